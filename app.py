@@ -2,6 +2,7 @@
 
 import tkinter as tk
 from gamecontroller import ControladorJuego
+from gamelayout import ANCHO_CANVAS, ALTO_CANVAS
 
 class Aplicacion(tk.Tk):
     # Clase principal de la aplicación
@@ -10,8 +11,12 @@ class Aplicacion(tk.Tk):
         # Configurar ventana principal
         super().__init__()
         self.title("Solitario Reloj MVC")
-        self.geometry("800x700")
-        self.resizable(False, False)
+        
+        # Tamaño inicial según la densidad de la pantalla (96 ppp = escala 1)
+        escala_pantalla = max(1.0, self.winfo_fpixels('1i') / 96)
+        self.geometry(f"{round(ANCHO_CANVAS * escala_pantalla)}x{round(ALTO_CANVAS * escala_pantalla)}")
+        self.minsize(ANCHO_CANVAS // 2, ALTO_CANVAS // 2)
+        self.resizable(True, True)
         
         # Crear controlador principal
         controlador = ControladorJuego(self)
@@ -1,19 +1,33 @@
 # assets.py - Gestor de Recursos del Juego
 
 import os
-from PIL import Image, ImageTk
+from collections import OrderedDict
+from PIL import Image
+
+# Tamaño base de las cartas y límite de memoria de la caché de imágenes
+TAMANO_BASE = (75, 110)
+LIMITE_CACHE_BYTES = 64 * 1024 * 1024
+REVERSO_POR_DEFECTO = 'back'
+
 
 class GestorRecursos:
     # Clase para manejar las imágenes de cartas
-    
-    def __init__(self):
-        # Inicializar y cargar todas las imágenes
-        self.imagenes = {}
+
+    def __init__(self, ruta_imagenes="cartas_img", limite_bytes=LIMITE_CACHE_BYTES):
+        # Guardar las imágenes originales; las escaladas se generan bajo demanda
+        self.ruta_imagenes = ruta_imagenes
+        self.limite_bytes = limite_bytes
+        self.originales = {}
+        self.archivos = {}
+        self.cache = OrderedDict()
+        self.bytes_en_cache = 0
+        self.tamano = TAMANO_BASE
+        self.reverso = REVERSO_POR_DEFECTO
         self._cargar_imagenes()
-    
+
     def _cargar_imagenes(self):
-        # Cargar todas las imágenes de cartas
-        ruta_imagenes = "cartas_img"
+        # Localizar todas las imágenes de cartas y reversos
+        ruta_imagenes = self.ruta_imagenes
         if not os.path.exists(ruta_imagenes):
             print(f"Error: La carpeta '{ruta_imagenes}' no fue encontrada.")
             return
@@ -23,34 +37,105 @@ class GestorRecursos:
         mapa_valores_archivo = {'A': '1', 'J': 'jack', 'Q': 'queen', 'K': 'king'}
 
         try:
-            # Cargar imagen del reverso
-            archivo_reverso = os.path.join(ruta_imagenes, "back.png")
-            imagen_reverso = Image.open(archivo_reverso).resize((75, 110))
-            self.imagenes['back'] = ImageTk.PhotoImage(imagen_reverso)
+            # Reversos disponibles: back.png y los temas back-*.png
+            for nombre_archivo in sorted(os.listdir(ruta_imagenes)):
+                if nombre_archivo == "back.png" or nombre_archivo.startswith("back-"):
+                    tema = nombre_archivo[:-len(".png")]
+                    self.archivos[tema] = os.path.join(ruta_imagenes, nombre_archivo)
 
-            # Cargar todas las cartas
-            for simbolo_palo in mapa_palos.values():
+            # Todas las cartas
+            for palo_archivo, simbolo_palo in mapa_palos.items():
                 for valor in ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']:
                     nombre_carta = f"{valor}{simbolo_palo}"
-                    
-                    # Construir nombre del archivo
-                    palo_archivo = [k for k, v in mapa_palos.items() if v == simbolo_palo][0]
                     valor_archivo = mapa_valores_archivo.get(valor, valor)
-                    
-                    nombre_archivo = f"{palo_archivo}_{valor_archivo}.png"
-                    ruta_archivo = os.path.join(ruta_imagenes, nombre_archivo)
-                    
-                    # Cargar imagen si existe
+                    ruta_archivo = os.path.join(ruta_imagenes, f"{palo_archivo}_{valor_archivo}.png")
+
                     if os.path.exists(ruta_archivo):
-                        imagen = Image.open(ruta_archivo).resize((75, 110))
-                        self.imagenes[nombre_carta] = ImageTk.PhotoImage(imagen)
+                        self.archivos[nombre_carta] = ruta_archivo
                     else:
                         print(f"Advertencia: No se encontró la imagen {ruta_archivo}")
 
+            # Cargar ahora las cartas y el reverso actual; los demás temas, al elegirlos
+            for nombre in self.archivos:
+                if not nombre.startswith('back') or nombre == self.reverso:
+                    self._obtener_original(nombre)
+
         except Exception as e:
             print(f"Error cargando las imágenes: {e}")
             pass
 
-    def obtener_imagen(self, nombre_carta):
-        # Obtener imagen de una carta específica
-        return self.imagenes.get(nombre_carta, self.imagenes.get('back'))
\ No newline at end of file
+    def _obtener_original(self, nombre):
+        # Imagen a resolución completa, leída del disco una sola vez
+        if nombre not in self.originales:
+            ruta_archivo = self.archivos.get(nombre)
+            if ruta_archivo is None:
+                return None
+            imagen = Image.open(ruta_archivo)
+            imagen.load()
+            self.originales[nombre] = imagen
+        return self.originales[nombre]
+
+    def establecer_tamano(self, ancho, alto):
+        # Tamaño con el que se servirán las cartas a partir de ahora
+        self.tamano = (max(1, int(ancho)), max(1, int(alto)))
+
+    def temas_reverso(self):
+        # Nombres de los reversos disponibles ('back', 'back-red', ...)
+        return [nombre for nombre in self.archivos if nombre.startswith('back')]
+
+    def cambiar_reverso(self, tema):
+        # Elegir otro reverso; las cartas ya escaladas siguen en caché
+        if tema not in self.archivos:
+            print(f"Advertencia: No existe el reverso '{tema}'")
+            return False
+        self.reverso = tema
+        return True
+
+    def obtener_imagen(self, nombre_carta, tamano=None):
+        # Obtener imagen de una carta específica al tamaño pedido
+        tamano = tamano or self.tamano
+        nombre = self.reverso if nombre_carta == 'back' else nombre_carta
+        if nombre not in self.archivos:
+            nombre = self.reverso
+        clave = (nombre, tamano)
+
+        imagen = self.cache.get(clave)
+        if imagen is not None:
+            self.cache.move_to_end(clave)
+            return imagen
+
+        escalada = self.obtener_imagen_pil(nombre_carta, tamano)
+        if escalada is None:
+            return None
+        # ImageTk importa tkinter: solo se carga en la interfaz, no al renderizar sin ventana
+        from PIL import ImageTk
+        imagen = ImageTk.PhotoImage(escalada)
+        self.cache[clave] = imagen
+        self.bytes_en_cache += self._bytes_imagen(tamano)
+        self._liberar_memoria()
+        return imagen
+
+    def obtener_imagen_pil(self, nombre_carta, tamano=None):
+        # Carta escalada como imagen de Pillow (no necesita ventana de Tk)
+        nombre = self.reverso if nombre_carta == 'back' else nombre_carta
+        if nombre not in self.archivos:
+            nombre = self.reverso
+        original = self._obtener_original(nombre)
+        if original is None:
+            return None
+        return original.resize(tamano or self.tamano)
+
+    def _bytes_imagen(self, tamano):
+        # Memoria aproximada de una imagen RGBA
+        return tamano[0] * tamano[1] * 4
+
+    def _liberar_memoria(self):
+        # Quitar las imágenes menos usadas; nunca las del tamaño actual,
+        # porque pueden estar dibujadas en el lienzo
+        for clave in list(self.cache):
+            if self.bytes_en_cache <= self.limite_bytes:
+                break
+            if clave[1] == self.tamano:
+                continue
+            del self.cache[clave]
+            self.bytes_en_cache -= self._bytes_imagen(clave[1])
@@ -0,0 +1,82 @@
+# benchmark_memory.py - Memoria por partida: ModeloJuego frente a JuegoCompacto
+
+import random
+import sys
+import time
+import tracemalloc
+
+from gamemodel import ModeloJuego
+from gamecompact import AlmacenJuegos, TAM_ESTADO
+
+PARTIDAS_COMPACTAS = 1_000_000
+PARTIDAS_MODELO = 10_000
+PARTIDAS_TRAZADAS = 100_000
+LIMITE_BYTES_POR_JUEGO = 100
+
+
+def medir(crear):
+    # Bytes reservados por lo que devuelve crear() y el tiempo que tardó
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    objeto = crear()
+    duracion = time.perf_counter() - inicio
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return objeto, memoria, duracion
+
+
+def crear_modelos(total):
+    # Partidas clásicas, cada una repartida y con un movimiento hecho
+    modelos = []
+    for _ in range(total):
+        modelo = ModeloJuego()
+        modelo.modo_juego = 'auto'
+        modelo.barajar_y_repartir()
+        modelo.ejecutar_paso_automatico()
+        modelos.append(modelo)
+    return modelos
+
+
+def repartir_almacen(almacen):
+    # Las mismas partidas, todas dentro del bytearray del almacén.
+    # Devuelve la última vista, que sigue en uso al medir
+    juego = None
+    for indice in range(len(almacen)):
+        juego = almacen.juego(indice)
+        juego.modo_juego = 'auto'
+        juego.barajar_y_repartir()
+        juego.ejecutar_paso_automatico()
+    return juego
+
+
+def crear_y_repartir_almacen(total):
+    almacen = AlmacenJuegos(total)
+    return almacen, repartir_almacen(almacen)
+
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else PARTIDAS_COMPACTAS
+    random.seed(0)
+
+    _, memoria_modelo, _ = medir(lambda: crear_modelos(PARTIDAS_MODELO))
+    por_modelo = memoria_modelo / PARTIDAS_MODELO
+    print(f"ModeloJuego:   {por_modelo:8.1f} bytes/partida ({PARTIDAS_MODELO} partidas)")
+
+    # Memoria retenida después de repartir y jugar a través de las vistas:
+    # cuenta todo lo que una vista deje vivo, no solo el bytearray inicial.
+    # Trazar cada asignación es lento, así que se traza una muestra
+    trazadas = min(total, PARTIDAS_TRAZADAS)
+    (almacen, ultima_vista), memoria_compacta, _ = medir(lambda: crear_y_repartir_almacen(trazadas))
+    por_juego = memoria_compacta / trazadas
+    del almacen, ultima_vista
+
+    inicio = time.perf_counter()
+    almacen, _ = crear_y_repartir_almacen(total)
+    duracion = time.perf_counter() - inicio
+    print(f"JuegoCompacto: {por_juego:8.1f} bytes/partida ({trazadas} partidas trazadas, "
+          f"{TAM_ESTADO} bytes de estado; {total} partidas en {duracion:.1f} s)")
+    print(f"Reducción: {por_modelo / por_juego:.1f}x")
+
+    if por_juego > LIMITE_BYTES_POR_JUEGO:
+        print(f"ERROR: se superan los {LIMITE_BYTES_POR_JUEGO} bytes por partida.")
+        sys.exit(1)
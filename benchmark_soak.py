@@ -0,0 +1,187 @@
+# benchmark_soak.py - Sesión larga: widgets, elementos del lienzo y memoria deben mantenerse estables
+#
+# Con Tk real necesita una pantalla; en un servidor: xvfb-run python benchmark_soak.py [partidas]
+# Sin pantalla: python benchmark_soak.py [partidas] --stub (tkinter simulado, ver tkstub.py)
+
+import os
+import random
+import resource
+import sys
+import time
+
+PARTIDAS = 2000
+PARTIDAS_CALENTAMIENTO = 50
+CADA_CUANTAS_ABANDONAR = 10
+CADA_CUANTAS_AUTOMATICA = 4
+MOVIMIENTOS_ANTES_DE_MUESTREAR = 8
+CLICS_ANTES_DE_ABANDONAR = 20
+ACELERACION_TK = 50  # Con Tk real los temporizadores esperan 50 veces menos
+CRECIMIENTO_RSS_MAX = 5 * 1024 * 1024
+
+
+def contar_widgets(widget):
+    # Widget actual más todos sus descendientes
+    return 1 + sum(contar_widgets(hijo) for hijo in widget.winfo_children())
+
+
+def memoria_residente():
+    # RSS actual en bytes (Linux); en otros sistemas, el máximo alcanzado
+    try:
+        with open("/proc/self/statm") as archivo:
+            return int(archivo.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def medir(ventana, controlador):
+    return contar_widgets(ventana), len(controlador.vista.lienzo.find_all()), memoria_residente()
+
+
+def esperar(ventana, condicion):
+    # Procesar temporizadores hasta que se cumpla la condición
+    while not condicion():
+        if hasattr(ventana, 'avanzar'):
+            # tkstub: saltar directamente al siguiente temporizador
+            if not ventana.avanzar():
+                raise RuntimeError("No quedan temporizadores pendientes y la partida no avanzó.")
+        else:
+            ventana.update()
+            time.sleep(0.001)
+
+
+def cancelar_temporizadores(ventana):
+    # Quitar los after() que queden de la partida anterior (p. ej. la vuelta
+    # al menú tras abandonar) para que no interrumpan la siguiente
+    for identificador in ventana.tk.splitlist(ventana.tk.call('after', 'info')):
+        ventana.after_cancel(identificador)
+
+
+def elementos_sobrantes(controlador):
+    # Elementos del lienzo de más respecto a dibujar el mismo estado desde cero.
+    # Deja el tablero redibujado limpio y la partida sigue igual
+    vista = controlador.vista
+    antes = len(vista.lienzo.find_all())
+    vista.mostrar_menu()
+    vista.dibujar_tablero(controlador.modelo.obtener_estado_tablero())
+    return antes - len(vista.lienzo.find_all())
+
+
+def muestrear_tablero(ventana, controlador, muestras):
+    muestras.append((elementos_sobrantes(controlador), contar_widgets(ventana)))
+
+
+def jugar_partida_manual(ventana, controlador, colocadas, muestras, abandonar):
+    # Partida manual con clics correctos y algún fallo, como un jugador
+    controlador.iniciar_juego_nuevo('manual')
+    modelo = controlador.modelo
+    clics = 0
+    muestreada = False
+    while not modelo.juego_terminado:
+        if abandonar and clics == CLICS_ANTES_DE_ABANDONAR:
+            controlador.terminar_juego_actual()
+            break
+        destino = modelo.revelacion_pendiente or modelo.obtener_destino_carta(modelo.carta_actual)
+        if random.random() < 0.1:
+            controlador.manejar_clic_monton(random.randint(1, 13))
+        controlador.manejar_clic_monton(destino)
+        clics += 1
+        ventana.update()
+        if not muestreada and colocadas[0] >= MOVIMIENTOS_ANTES_DE_MUESTREAR and not modelo.juego_terminado:
+            muestrear_tablero(ventana, controlador, muestras)
+            muestreada = True
+    controlador.verificar_fin_juego()
+
+
+def jugar_partida_automatica(ventana, controlador, colocadas, muestras):
+    # Partida automática completa, con sus animaciones y temporizadores
+    controlador.iniciar_juego_nuevo('auto')
+    modelo, vista = controlador.modelo, controlador.vista
+    esperar(ventana, lambda: modelo.juego_terminado
+            or (colocadas[0] >= MOVIMIENTOS_ANTES_DE_MUESTREAR and not vista.animacion_ejecutandose))
+    if not modelo.juego_terminado:
+        # Entre dos turnos: la animación anterior ya terminó
+        muestrear_tablero(ventana, controlador, muestras)
+    esperar(ventana, lambda: vista.pantalla_actual == 'menu')
+
+
+def ejecutar(partidas=PARTIDAS, stub=False):
+    if stub:
+        import tkstub
+        tkstub.instalar()
+    import tkinter as tk
+    from gamecontroller import ControladorJuego
+    from gamemodel import CartaColocada
+
+    if not stub:
+        # Acelerar animaciones y esperas para que la sesión no dure horas
+        after_original = tk.Misc.after
+        tk.Misc.after = lambda widget, ms, *argumentos: after_original(
+            widget, max(1, int(ms) // ACELERACION_TK), *argumentos)
+
+    random.seed(0)
+    ventana = tk.Tk()
+    ventana.geometry("800x700")
+    controlador = ControladorJuego(ventana)
+    # Sin diálogo modal: al terminar se vuelve directamente al menú
+    controlador.vista.mostrar_mensaje_fin_juego = lambda titulo, mensaje: controlador.mostrar_menu_principal()
+    # Cartas colocadas en la partida en curso, contadas con los eventos del modelo
+    colocadas = [0]
+    controlador.modelo.suscribir(
+        lambda cambios: colocadas.__setitem__(0, colocadas[0] + sum(isinstance(c, CartaColocada) for c in cambios)))
+    ventana.update()
+
+    base = None
+    muestras = []
+    automaticas = 0
+    for numero in range(partidas):
+        colocadas[0] = 0
+        if numero % CADA_CUANTAS_AUTOMATICA == CADA_CUANTAS_AUTOMATICA - 1:
+            jugar_partida_automatica(ventana, controlador, colocadas, muestras)
+            automaticas += 1
+        else:
+            jugar_partida_manual(ventana, controlador, colocadas, muestras,
+                                 numero % CADA_CUANTAS_ABANDONAR == 0)
+        cancelar_temporizadores(ventana)
+        controlador.mostrar_menu_principal()
+        ventana.update()
+        if numero % 100 == 0:
+            controlador.cambiar_reverso()
+            ventana.update()
+        if numero + 1 == PARTIDAS_CALENTAMIENTO:
+            base = medir(ventana, controlador)
+    final = medir(ventana, controlador)
+    ventana.destroy()
+    return base or final, final, muestras, automaticas
+
+
+if __name__ == "__main__":
+    argumentos = [argumento for argumento in sys.argv[1:] if argumento != "--stub"]
+    stub = "--stub" in sys.argv[1:]
+    partidas = int(argumentos[0]) if argumentos else PARTIDAS
+    (widgets_base, items_base, rss_base), (widgets, items, rss), muestras, automaticas = ejecutar(partidas, stub)
+
+    sobrantes = [sobrante for sobrante, _ in muestras]
+    widgets_en_partida = sorted({widgets_tablero for _, widgets_tablero in muestras})
+    print(f"Partidas:            {partidas} ({automaticas} automáticas){' con tkstub' if stub else ''}")
+    print(f"Muestras en tablero: {len(muestras)}, elementos sobrantes máx. {max(sobrantes, default=0)}, "
+          f"widgets {widgets_en_partida}")
+    print(f"Widgets en el menú:  {widgets_base} -> {widgets}")
+    print(f"Elementos en menú:   {items_base} -> {items}")
+    print(f"RSS:                 {rss_base / 2**20:.1f} MB -> {rss / 2**20:.1f} MB")
+
+    errores = []
+    if not muestras:
+        errores.append("no se tomó ninguna muestra durante las partidas")
+    if any(sobrantes):
+        errores.append("quedan elementos del lienzo de más durante las partidas")
+    if len(widgets_en_partida) > 1:
+        errores.append("el número de widgets cambió durante las partidas")
+    if widgets != widgets_base:
+        errores.append("el número de widgets creció")
+    if items != items_base:
+        errores.append("el número de elementos del lienzo creció")
+    if rss - rss_base > CRECIMIENTO_RSS_MAX:
+        errores.append("la memoria residente creció")
+    if errores:
+        print("ERROR: " + ", ".join(errores))
+        sys.exit(1)
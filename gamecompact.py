@@ -0,0 +1,304 @@
+# gamecompact.py - Estado compacto del Solitario Reloj para muchas partidas simultáneas
+
+from gamemodel import VALORES, PALOS, barajado_riffle
+
+# Codificación de cartas: valor * 4 + palo, 0xFF = sin carta / reverso
+NOMBRES_CARTAS = [f"{valor}{palo}" for valor in VALORES for palo in PALOS]
+CODIGOS_CARTAS = {nombre: codigo for codigo, nombre in enumerate(NOMBRES_CARTAS)}
+SIN_CARTA = 0xFF
+CARTAS_POR_MONTON = 4
+MENSAJE_JUEGO = "¿Voy a pasar Análisis Numérico?"
+MENSAJE_NO_GUARDADO = "(mensaje no guardado en el estado compacto)"
+# Índice 3 = cualquier otro texto: se acepta, pero se lee como MENSAJE_NO_GUARDADO
+MENSAJES = ("", MENSAJE_JUEGO, "No hay carta válida para mover.", MENSAJE_NO_GUARDADO)
+
+# Distribución de los bytes de una partida
+OFFSET_MONTONES = 0       # 13 montones x 4 cartas, en orden de salida
+OFFSET_SACADAS = 52       # cartas ya sacadas de cada montón (0-4)
+OFFSET_VISIBLES = 65      # carta visible de cada montón
+OFFSET_CARTA_ACTUAL = 78
+OFFSET_PENDIENTE = 79     # montón con revelación pendiente (0 = ninguno)
+OFFSET_ULTIMO = 80        # último montón movido (0 = ninguno)
+OFFSET_BANDERAS = 81      # bit 0: terminado, bits 1-2: modo, bit 3: repartido, bits 4-5: mensaje
+TAM_ESTADO = 82
+
+TERMINADO = 0x01
+MASCARA_MODO = 0x06
+REPARTIDO = 0x08
+MASCARA_MENSAJE = 0x30
+MODOS = {None: 0, 'auto': 1, 'manual': 2}
+NOMBRES_MODOS = {codigo: modo for modo, codigo in MODOS.items()}
+
+
+def _estado_inicial():
+    # Bytes de una partida sin repartir (igual que ModeloJuego recién creado)
+    datos = bytearray(TAM_ESTADO)
+    datos[OFFSET_SACADAS:OFFSET_SACADAS + 13] = bytes([CARTAS_POR_MONTON]) * 13
+    datos[OFFSET_VISIBLES:OFFSET_VISIBLES + 13] = bytes([SIN_CARTA]) * 13
+    datos[OFFSET_CARTA_ACTUAL] = SIN_CARTA
+    datos[OFFSET_BANDERAS] = TERMINADO
+    return bytes(datos)
+
+
+ESTADO_INICIAL = _estado_inicial()
+
+
+class JuegoCompacto:
+    # Misma interfaz que ModeloJuego, pero todo el estado vive en 82 bytes.
+    # Puede tener su propio bytearray o ser una vista sobre un AlmacenJuegos.
+    # Solo dentro de un AlmacenJuegos cuesta ~82 bytes por partida; una partida
+    # independiente (objeto + su propio bytearray) ocupa unos 187 bytes.
+
+    __slots__ = ('_datos', '_base')
+
+    def __init__(self, datos=None, base=0):
+        # Sin datos se crea una partida independiente
+        if datos is None:
+            datos = bytearray(ESTADO_INICIAL)
+        self._datos = datos
+        self._base = base
+
+    # --- Atributos equivalentes a los de ModeloJuego ---
+
+    @property
+    def carta_actual(self):
+        codigo = self._datos[self._base + OFFSET_CARTA_ACTUAL]
+        return None if codigo == SIN_CARTA else NOMBRES_CARTAS[codigo]
+
+    @carta_actual.setter
+    def carta_actual(self, carta):
+        self._datos[self._base + OFFSET_CARTA_ACTUAL] = SIN_CARTA if carta is None else CODIGOS_CARTAS[carta]
+
+    @property
+    def juego_terminado(self):
+        return bool(self._datos[self._base + OFFSET_BANDERAS] & TERMINADO)
+
+    @juego_terminado.setter
+    def juego_terminado(self, terminado):
+        posicion = self._base + OFFSET_BANDERAS
+        if terminado:
+            self._datos[posicion] |= TERMINADO
+        else:
+            self._datos[posicion] &= ~TERMINADO & 0xFF
+
+    @property
+    def modo_juego(self):
+        return NOMBRES_MODOS[(self._datos[self._base + OFFSET_BANDERAS] & MASCARA_MODO) >> 1]
+
+    @modo_juego.setter
+    def modo_juego(self, modo):
+        posicion = self._base + OFFSET_BANDERAS
+        self._datos[posicion] = (self._datos[posicion] & ~MASCARA_MODO & 0xFF) | (MODOS[modo] << 1)
+
+    @property
+    def revelacion_pendiente(self):
+        return self._datos[self._base + OFFSET_PENDIENTE] or None
+
+    @revelacion_pendiente.setter
+    def revelacion_pendiente(self, monton):
+        self._datos[self._base + OFFSET_PENDIENTE] = monton or 0
+
+    @property
+    def ultimo_movimiento_desde(self):
+        return self._datos[self._base + OFFSET_ULTIMO] or None
+
+    @ultimo_movimiento_desde.setter
+    def ultimo_movimiento_desde(self, monton):
+        self._datos[self._base + OFFSET_ULTIMO] = monton or 0
+
+    @property
+    def mensaje_ultimo_movimiento(self):
+        # El modelo solo guarda unos pocos mensajes fijos; se guarda su índice
+        return MENSAJES[(self._datos[self._base + OFFSET_BANDERAS] & MASCARA_MENSAJE) >> 4]
+
+    @mensaje_ultimo_movimiento.setter
+    def mensaje_ultimo_movimiento(self, mensaje):
+        # Acepta cualquier texto como ModeloJuego; los desconocidos no caben en 2 bits
+        indice = MENSAJES.index(mensaje) if mensaje in MENSAJES else len(MENSAJES) - 1
+        posicion = self._base + OFFSET_BANDERAS
+        self._datos[posicion] = (self._datos[posicion] & ~MASCARA_MENSAJE & 0xFF) | (indice << 4)
+
+    @property
+    def montones_ocultos(self):
+        # Copia en forma de dict, como en ModeloJuego
+        return {i: self._cartas_ocultas(i) for i in range(1, 14)}
+
+    @property
+    def montones_visibles(self):
+        if self._sin_repartir():
+            return {}
+        return {i: self._carta_visible(i) for i in range(1, 14)}
+
+    # --- Acceso interno a los bytes ---
+
+    def _sin_repartir(self):
+        return not self._datos[self._base + OFFSET_BANDERAS] & REPARTIDO
+
+    def _conteo_oculto(self, indice_monton):
+        return CARTAS_POR_MONTON - self._datos[self._base + OFFSET_SACADAS + indice_monton - 1]
+
+    def _cartas_ocultas(self, indice_monton):
+        inicio = self._base + OFFSET_MONTONES + (indice_monton - 1) * CARTAS_POR_MONTON
+        sacadas = self._datos[self._base + OFFSET_SACADAS + indice_monton - 1]
+        return [NOMBRES_CARTAS[c] for c in self._datos[inicio + sacadas:inicio + CARTAS_POR_MONTON]]
+
+    def _carta_visible(self, indice_monton):
+        codigo = self._datos[self._base + OFFSET_VISIBLES + indice_monton - 1]
+        return 'back' if codigo == SIN_CARTA else NOMBRES_CARTAS[codigo]
+
+    def _colocar_visible(self, indice_monton, carta):
+        self._datos[self._base + OFFSET_VISIBLES + indice_monton - 1] = CODIGOS_CARTAS[carta]
+
+    def _sacar_oculta(self, indice_monton):
+        # Equivalente a montones_ocultos[i].pop(0); None si está vacío
+        posicion_sacadas = self._base + OFFSET_SACADAS + indice_monton - 1
+        sacadas = self._datos[posicion_sacadas]
+        if sacadas >= CARTAS_POR_MONTON:
+            return None
+        self._datos[posicion_sacadas] = sacadas + 1
+        inicio = self._base + OFFSET_MONTONES + (indice_monton - 1) * CARTAS_POR_MONTON
+        return NOMBRES_CARTAS[self._datos[inicio + sacadas]]
+
+    # --- Reglas del juego (mismo comportamiento que ModeloJuego) ---
+
+    def barajar_y_repartir(self):
+        # Barajar con el mismo riffle y repartir en los 13 montones
+        mazo = barajado_riffle(list(NOMBRES_CARTAS))
+        self.repartir_mazo(mazo)
+
+    def repartir_mazo(self, mazo):
+        # Repartir un mazo de 52 cartas ya ordenado (útil para repeticiones)
+        if len(mazo) != 13 * CARTAS_POR_MONTON:
+            raise ValueError("El estado compacto solo admite mazos de 52 cartas.")
+        base = self._base
+        datos = self._datos
+        for i, carta in enumerate(mazo):
+            indice_monton = i % 13
+            posicion = i // 13
+            datos[base + OFFSET_MONTONES + indice_monton * CARTAS_POR_MONTON + posicion] = CODIGOS_CARTAS[carta]
+        # Como en ModeloJuego, el modo y los últimos movimientos se conservan
+        datos[base + OFFSET_SACADAS:base + OFFSET_SACADAS + 13] = bytes(13)
+        datos[base + OFFSET_VISIBLES:base + OFFSET_VISIBLES + 13] = bytes([SIN_CARTA]) * 13
+        datos[base + OFFSET_BANDERAS] = (datos[base + OFFSET_BANDERAS] & MASCARA_MODO) | REPARTIDO
+        self.carta_actual = self._sacar_oculta(13)
+        self.mensaje_ultimo_movimiento = MENSAJE_JUEGO
+
+    def obtener_destino_carta(self, carta):
+        if not carta or carta == 'back':
+            return None
+        valor = carta[:-1]
+        return VALORES.index(valor) + 1
+
+    def ejecutar_paso_automatico(self):
+        carta_a_mover = self.carta_actual
+        if not carta_a_mover:
+            self.mensaje_ultimo_movimiento = MENSAJES[2]
+            return False, MENSAJES[2]
+
+        destino = self.obtener_destino_carta(carta_a_mover)
+        self.ultimo_movimiento_desde = destino
+        self._colocar_visible(destino, carta_a_mover)
+
+        siguiente = self._sacar_oculta(destino)
+        self.carta_actual = siguiente
+        self.mensaje_ultimo_movimiento = MENSAJE_JUEGO
+        if siguiente:
+            return True, MENSAJE_JUEGO
+        self.juego_terminado = True
+        return False, MENSAJE_JUEGO
+
+    def terminar_juego(self):
+        # Terminar la partida desde fuera (sin oyentes en el estado compacto)
+        self.juego_terminado = True
+
+    def revelar_siguiente_carta(self, indice_monton):
+        # Revelar siguiente carta de un montón
+        carta = self._sacar_oculta(indice_monton)
+        self.carta_actual = carta
+        self.mensaje_ultimo_movimiento = MENSAJE_JUEGO
+        if carta:
+            self.revelacion_pendiente = None
+            return carta
+        self.juego_terminado = True
+        return None
+
+    def ejecutar_paso_manual(self, monton_clickeado):
+        # Ejecutar paso manual según clic del usuario
+        carta_a_mover = self.carta_actual
+        if not carta_a_mover:
+            return False, "No hay carta para mover. El juego terminó."
+
+        destino_esperado = self.obtener_destino_carta(carta_a_mover)
+        if monton_clickeado == destino_esperado:
+            self._colocar_visible(destino_esperado, carta_a_mover)
+            self.ultimo_movimiento_desde = destino_esperado
+            self.revelacion_pendiente = destino_esperado
+            self.carta_actual = None
+            mensaje = f"Carta {carta_a_mover} colocada en montón {destino_esperado}. Haz clic en el montón {destino_esperado} para revelar la siguiente."
+            return True, mensaje
+        mensaje = f"Movimiento incorrecto. La carta {carta_a_mover} debe ir al montón {destino_esperado}."
+        return False, mensaje
+
+    def intentar_revelar_de_monton(self, monton_clickeado):
+        pendiente = self.revelacion_pendiente
+        if pendiente and monton_clickeado == pendiente:
+            return self.revelar_siguiente_carta(pendiente)
+        return None
+
+    def verificar_estado_juego(self):
+        if self._sin_repartir():
+            return 'en_progreso'
+
+        visibles = [self._carta_visible(i) for i in range(1, 14)]
+        reyes_visibles = sum(1 for carta in visibles if carta != 'back' and carta.startswith('K'))
+        if reyes_visibles >= 4:
+            return 'derrota'
+
+        if not self.carta_actual and self.juego_terminado:
+            todas_correctas = all(carta != 'back' and carta.startswith(VALORES[i])
+                                  for i, carta in enumerate(visibles))
+            total_ocultas = sum(self._conteo_oculto(i) for i in range(1, 14))
+            if todas_correctas and total_ocultas == 0:
+                return 'victoria'
+            return 'derrota'
+
+        if self.juego_terminado:
+            return 'derrota'
+        return 'en_progreso'
+
+    def verificar_victoria(self):
+        return self.verificar_estado_juego() == 'victoria'
+
+    def obtener_estado_tablero(self):
+        # Mismo formato que ModeloJuego.obtener_estado_tablero
+        return {
+            'visible': self.montones_visibles,
+            'conteos_ocultos': {i: self._conteo_oculto(i) for i in range(1, 14)},
+            'carta_actual': self.carta_actual,
+            'mensaje': self.mensaje_ultimo_movimiento,
+            'revelacion_pendiente': self.revelacion_pendiente,
+            'ultimo_movimiento_desde': self.ultimo_movimiento_desde
+        }
+
+    def reiniciar_juego(self):
+        self._datos[self._base:self._base + TAM_ESTADO] = ESTADO_INICIAL
+
+
+class AlmacenJuegos:
+    # Muchas partidas en un único bytearray; cada partida ocupa TAM_ESTADO bytes.
+    # juego(i) devuelve una vista ligera que se puede descartar tras usarla.
+
+    def __init__(self, capacidad):
+        self.capacidad = capacidad
+        self.datos = bytearray(ESTADO_INICIAL * capacidad)
+
+    def __len__(self):
+        return self.capacidad
+
+    def juego(self, indice):
+        if not 0 <= indice < self.capacidad:
+            raise IndexError(f"No existe la partida {indice}.")
+        return JuegoCompacto(self.datos, indice * TAM_ESTADO)
+
+    def bytes_por_juego(self):
+        return len(self.datos) / self.capacidad if self.capacidad else 0
@@ -11,17 +11,14 @@ class ControladorJuego:
         # Inicializar componentes del juego
         self.ventana_padre = ventana_padre
         self.modelo = ModeloJuego()
+        self.cambios_pendientes = []
+        self.version_dibujada = None
+        self.modelo.suscribir(self.cambios_pendientes.extend)
         self.recursos = GestorRecursos()
         self.vista = VistaJuego(ventana_padre, self, self.recursos)
         self.vista.pack(fill="both", expand=True)
         self.mostrar_menu_principal()
 
-    def mostrar_menu_principal(self):
-        # Mostrar menú principal
-        self.modelo.juego_terminado = True
-        self.modelo.modo_juego = None
-        self.vista.mostrar_menu()
-
     def iniciar_juego_nuevo(self, modo):
         # Iniciar nuevo juego en el modo especificado
         self.modelo.modo_juego = modo
@@ -47,7 +44,7 @@ class ControladorJuego:
                     self.vista.mostrar_carta_revelada(carta_revelada, indice_monton)
                     self.vista.mostrar_mensaje_estado(f"Nueva carta revelada: {carta_revelada}. ¡A jugar!")
                 else:
-                    self.modelo.juego_terminado = True
+                    self.modelo.terminar_juego()
                     self.ventana_padre.after(500, self.verificar_fin_juego)
                 self.actualizar_vista()
             else:
@@ -93,11 +90,18 @@ class ControladorJuego:
         self.vista.animar_movimiento_carta(carta_a_mover, origen, destino, despues_animacion)
 
     def actualizar_vista(self):
-        # Actualizar vista con estado actual
-        estado_tablero = self.modelo.obtener_estado_tablero()
-        self.vista.dibujar_tablero(estado_tablero)
-        carta_actual = estado_tablero.get('carta_actual')
-        self.vista.actualizar_etiquetas_estado(carta_actual)
+        # Enviar a la vista solo los cambios desde el último dibujo
+        if self.vista.pantalla_actual == 'tablero' and self.modelo.version == self.version_dibujada:
+            return
+        cambios = self.cambios_pendientes[:]
+        self.cambios_pendientes.clear()
+
+        if self.vista.pantalla_actual != 'tablero':
+            # Venimos del menú o de una animación: hace falta el tablero completo
+            self.vista.dibujar_tablero(self.modelo.obtener_estado_tablero())
+        else:
+            self.vista.aplicar_cambios(cambios)
+        self.version_dibujada = self.modelo.version
 
     def verificar_fin_juego(self):
         # Verificar si terminó el juego
@@ -147,9 +151,19 @@ class ControladorJuego:
         
         self.vista.animar_barajado(funcion_callback=despues_animacion_barajado)
 
+    def cambiar_reverso(self):
+        # Pasar al siguiente diseño de reverso de cartas
+        temas = self.recursos.temas_reverso()
+        if not temas:
+            return
+        actual = self.recursos.reverso
+        siguiente = temas[(temas.index(actual) + 1) % len(temas)] if actual in temas else temas[0]
+        self.vista.cambiar_reverso(siguiente)
+        self.vista.mostrar_mensaje_estado(f"Reverso de cartas: {siguiente}")
+
     def terminar_juego_actual(self):
         # Terminar juego actual y volver al menú
-        self.modelo.juego_terminado = True
+        self.modelo.terminar_juego()
         self.modelo.modo_juego = None
         self.vista.mostrar_mensaje_estado("Juego terminado. ¡Vuelve a intentarlo!")
         self.ventana_padre.after(500, self.mostrar_menu_principal)
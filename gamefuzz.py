@@ -0,0 +1,264 @@
+# gamefuzz.py - Búsqueda de errores en el modelo con partidas aleatorias
+
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from gamemodel import ModeloJuego, VALORES, PALOS, barajado_riffle
+from gamecompact import JuegoCompacto
+
+MAZO_ORDENADO = [f"{valor}{palo}" for valor in VALORES for palo in PALOS]
+TAMANO_LOTE = 2000
+PROBABILIDAD_CLIC_CORRECTO = 0.6
+MAX_CLICS_ALEATORIOS = 200
+
+
+class FalloInvariante(Exception):
+    # Una regla del juego que no se cumple
+    pass
+
+
+def generar_partida(semilla):
+    # Reparto y clics manuales reproducibles a partir de una semilla
+    generador = random.Random(semilla)
+    if generador.random() < 0.5:
+        # Mismo barajado que el juego (usa el random global)
+        estado_global = random.getstate()
+        random.seed(semilla)
+        mazo = barajado_riffle(list(MAZO_ORDENADO))
+        random.setstate(estado_global)
+    else:
+        mazo = list(MAZO_ORDENADO)
+        generador.shuffle(mazo)
+
+    # Clics mezclando aciertos y errores, siguiendo la partida para saber el destino
+    modelo = ModeloJuego()
+    modelo.modo_juego = 'manual'
+    modelo.repartir_mazo(mazo)
+    clics = []
+    for _ in range(generador.randint(0, MAX_CLICS_ALEATORIOS)):
+        if modelo.juego_terminado:
+            break
+        correcto = modelo.revelacion_pendiente or modelo.obtener_destino_carta(modelo.carta_actual)
+        if generador.random() < PROBABILIDAD_CLIC_CORRECTO:
+            clic = correcto
+        else:
+            clic = generador.randint(1, 13)
+        clics.append(clic)
+        _aplicar_clic(modelo, clic)
+    return mazo, clics
+
+
+def _aplicar_clic(modelo, clic):
+    # Mismo flujo que ControladorJuego.manejar_clic_monton
+    if modelo.juego_terminado:
+        return None
+    if modelo.revelacion_pendiente:
+        if clic == modelo.revelacion_pendiente:
+            carta = modelo.intentar_revelar_de_monton(clic)
+            if not carta:
+                modelo.terminar_juego()
+            return carta
+        return None
+    return modelo.ejecutar_paso_manual(clic)
+
+
+def _clic_correcto(modelo):
+    return modelo.revelacion_pendiente or modelo.obtener_destino_carta(modelo.carta_actual)
+
+
+def _foto(modelo):
+    # Estado comparable entre implementaciones
+    estado = modelo.obtener_estado_tablero()
+    return (dict(estado['visible']), estado['conteos_ocultos'], estado['carta_actual'],
+            estado['revelacion_pendiente'], estado['ultimo_movimiento_desde'],
+            modelo.juego_terminado, modelo.verificar_estado_juego())
+
+
+def _verificar(condicion, mensaje):
+    if not condicion:
+        raise FalloInvariante(mensaje)
+
+
+def comprobar_invariantes(modelo, reveladas):
+    # Reglas que deben cumplirse después de cada acción
+    ocultas = [carta for monton in modelo.montones_ocultos.values() for carta in monton]
+    _verificar(len(ocultas) + len(reveladas) == 52,
+               f"Se perdieron o duplicaron cartas: {len(ocultas)} ocultas + {len(reveladas)} reveladas")
+    _verificar(set(ocultas).isdisjoint(reveladas), "Una carta está a la vez oculta y revelada")
+    _verificar(set(ocultas) | reveladas == set(MAZO_ORDENADO), "Faltan cartas de la baraja")
+
+    estado = modelo.obtener_estado_tablero()
+    _verificar(sum(estado['conteos_ocultos'].values()) == len(ocultas),
+               "Los conteos ocultos no coinciden con los montones")
+    for indice, carta in modelo.montones_visibles.items():
+        if carta != 'back':
+            _verificar(carta in reveladas, f"La carta visible {carta} nunca se reveló")
+            _verificar(modelo.obtener_destino_carta(carta) == indice,
+                       f"La carta {carta} está en el montón {indice}")
+
+    carta_actual = modelo.carta_actual
+    if carta_actual:
+        _verificar(carta_actual in reveladas, f"La carta actual {carta_actual} no se reveló")
+        _verificar(not modelo.juego_terminado, "Hay carta actual con el juego terminado")
+    _verificar(not (carta_actual and modelo.revelacion_pendiente),
+               "Hay carta actual y revelación pendiente a la vez")
+
+    resultado = modelo.verificar_estado_juego()
+    if not modelo.juego_terminado:
+        _verificar(resultado == 'en_progreso', f"Juego sin terminar con resultado '{resultado}'")
+    else:
+        _verificar(resultado in ('victoria', 'derrota'), f"Juego terminado con resultado '{resultado}'")
+        _verificar((resultado == 'victoria') == (len(ocultas) == 0),
+                   f"Resultado '{resultado}' con {len(ocultas)} cartas ocultas")
+    _verificar(modelo.verificar_victoria() == (resultado == 'victoria'),
+               "verificar_victoria no coincide con verificar_estado_juego")
+
+
+def _jugar_automatico(mazo):
+    modelo = ModeloJuego()
+    modelo.modo_juego = 'auto'
+    modelo.repartir_mazo(mazo)
+    reveladas = {modelo.carta_actual}
+    movimientos = 0
+    comprobar_invariantes(modelo, reveladas)
+    while modelo.carta_actual:
+        continua, _ = modelo.ejecutar_paso_automatico()
+        movimientos += 1
+        if continua:
+            reveladas.add(modelo.carta_actual)
+        comprobar_invariantes(modelo, reveladas)
+    _verificar(modelo.juego_terminado, "La partida automática no terminó")
+    return modelo, movimientos
+
+
+def comprobar_partida(mazo, clics):
+    # Jugar un reparto en automático y en manual (modelo normal y compacto)
+    # y comprobar que todo coincide. Devuelve el mensaje del fallo o None.
+    try:
+        automatico, movimientos = _jugar_automatico(mazo)
+
+        manual = ModeloJuego()
+        compacto = JuegoCompacto()
+        for modelo in (manual, compacto):
+            modelo.modo_juego = 'manual'
+            modelo.repartir_mazo(mazo)
+        reveladas = {manual.carta_actual}
+        _verificar(_foto(manual) == _foto(compacto), "El modelo compacto difiere tras repartir")
+
+        # Primero los clics grabados y después siempre el clic correcto
+        pendientes = iter(clics)
+        colocadas = 0
+        while not manual.juego_terminado:
+            clic = next(pendientes, None) or _clic_correcto(manual)
+            antes = _foto(manual)
+            resultado = _aplicar_clic(manual, clic)
+            _verificar(resultado == _aplicar_clic(compacto, clic),
+                       f"El modelo compacto responde distinto al clic {clic}")
+            _verificar(_foto(manual) == _foto(compacto),
+                       f"El modelo compacto difiere tras el clic {clic}")
+            if isinstance(resultado, tuple):
+                if resultado[0]:
+                    colocadas += 1
+                else:
+                    _verificar(_foto(manual) == antes, f"Un clic incorrecto ({clic}) cambió el tablero")
+            elif resultado:
+                reveladas.add(resultado)
+            elif not manual.juego_terminado:
+                _verificar(_foto(manual) == antes, f"Un clic fuera del montón pendiente ({clic}) cambió el tablero")
+            comprobar_invariantes(manual, reveladas)
+            _verificar(colocadas <= 52, "Se colocaron más de 52 cartas")
+
+        _verificar(colocadas == movimientos,
+                   f"Manual colocó {colocadas} cartas y automático {movimientos}")
+        _verificar(manual.montones_visibles == automatico.montones_visibles,
+                   "Manual y automático terminan con montones distintos")
+        _verificar(manual.verificar_estado_juego() == automatico.verificar_estado_juego(),
+                   "Manual y automático terminan con resultados distintos")
+        _verificar((automatico.verificar_estado_juego() == 'victoria') == (movimientos == 52),
+                   f"Resultado '{automatico.verificar_estado_juego()}' tras {movimientos} movimientos")
+    except FalloInvariante as fallo:
+        return str(fallo)
+    except Exception as error:
+        return f"{type(error).__name__}: {error}"
+    return None
+
+
+def reducir_fallo(mazo, clics):
+    # Buscar un reparto y una lista de clics mínimos que sigan fallando
+    mensaje = comprobar_partida(mazo, clics)
+    if mensaje is None:
+        return mazo, clics, None
+
+    # Quitar clics: primero bloques grandes, luego de uno en uno
+    tamano = max(1, len(clics) // 2)
+    while tamano >= 1:
+        inicio = 0
+        while inicio < len(clics):
+            candidato = clics[:inicio] + clics[inicio + tamano:]
+            if comprobar_partida(mazo, candidato) is not None:
+                clics = candidato
+            else:
+                inicio += tamano
+        tamano //= 2
+
+    # Acercar el reparto al mazo ordenado con intercambios
+    mejorado = True
+    while mejorado:
+        mejorado = False
+        for posicion, carta in enumerate(MAZO_ORDENADO):
+            if mazo[posicion] == carta:
+                continue
+            candidato = list(mazo)
+            otra = candidato.index(carta)
+            candidato[posicion], candidato[otra] = candidato[otra], candidato[posicion]
+            if comprobar_partida(candidato, clics) is not None:
+                mazo = candidato
+                mejorado = True
+
+    return mazo, clics, comprobar_partida(mazo, clics)
+
+
+def _fuzz_lote(semilla_inicial, cantidad):
+    # Trabajador: probar un lote de semillas y devolver los fallos
+    fallos = []
+    for semilla in range(semilla_inicial, semilla_inicial + cantidad):
+        mazo, clics = generar_partida(semilla)
+        mensaje = comprobar_partida(mazo, clics)
+        if mensaje is not None:
+            fallos.append((semilla, mazo, clics, mensaje))
+    return cantidad, fallos
+
+
+def fuzz(total_partidas, procesos=None, semilla=0, tamano_lote=TAMANO_LOTE, max_fallos=1):
+    # Repartir las semillas entre procesos; parar en cuanto haya max_fallos
+    procesos = procesos or os.cpu_count() or 1
+    probadas = 0
+    fallos = []
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        futuros = [ejecutor.submit(_fuzz_lote, inicio, min(tamano_lote, semilla + total_partidas - inicio))
+                   for inicio in range(semilla, semilla + total_partidas, tamano_lote)]
+        for futuro in as_completed(futuros):
+            cantidad, nuevos = futuro.result()
+            probadas += cantidad
+            fallos.extend(nuevos)
+            if len(fallos) >= max_fallos:
+                for pendiente in futuros:
+                    pendiente.cancel()
+                break
+    reducidos = [(semilla_fallo, *reducir_fallo(mazo, clics)) for semilla_fallo, mazo, clics, _ in fallos]
+    return probadas, reducidos
+
+
+if __name__ == "__main__":
+    # Uso: python gamefuzz.py [partidas] [procesos]
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    procesos = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    probadas, fallos = fuzz(total, procesos)
+    print(f"Partidas probadas: {probadas}")
+    for semilla_fallo, mazo, clics, mensaje in fallos:
+        print(f"\nFallo (semilla {semilla_fallo}): {mensaje}")
+        print(f"Mazo mínimo: {mazo}")
+        print(f"Clics mínimos: {clics}")
+    sys.exit(1 if fallos else 0)
@@ -0,0 +1,27 @@
+# gamelayout.py - Medidas y posiciones del tablero (sin Tk, para vista y renderizador)
+
+import math
+
+# Constantes del juego (medidas base para escala 1)
+ANCHO_CARTA, ALTO_CARTA = 75, 110
+ANCHO_CANVAS, ALTO_CANVAS = 800, 700
+DESPLAZAMIENTO_MONTON_X = 3
+DESPLAZAMIENTO_MONTON_Y = 3
+RADIO_RELOJ = 250
+
+
+def calcular_posiciones_montones(ancho_lienzo, alto_lienzo, ancho_carta, alto_carta, radio):
+    # Esquina superior izquierda de cada montón, en forma de reloj
+    posiciones = {}
+    centro_x, centro_y = ancho_lienzo / 2, alto_lienzo / 2
+
+    # Montones 1-12 en círculo como reloj
+    for i in range(1, 13):
+        angulo = math.radians(-60 + (i * 30))  # -60°
+        x = centro_x + radio * math.cos(angulo) - (ancho_carta / 2)
+        y = centro_y + radio * math.sin(angulo) - (alto_carta / 2)
+        posiciones[i] = (x, y)
+
+    # Montón 13 en el centro
+    posiciones[13] = (centro_x - ancho_carta / 2, centro_y - alto_carta / 2)
+    return posiciones
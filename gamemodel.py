@@ -1,11 +1,67 @@
 # gamemodel.py - Modelo del Juego Solitario Reloj
 
 import random
+from collections import namedtuple
 
 
 VALORES = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
 PALOS = ['♠', '♥', '♦', '♣']
 
+# Eventos de cambio del modelo; cada uno lleva la versión que lo produjo
+TableroRepartido = namedtuple('TableroRepartido', 'version visibles conteos_ocultos carta_actual')
+TableroReiniciado = namedtuple('TableroReiniciado', 'version')
+CartaColocada = namedtuple('CartaColocada', 'version monton carta')
+ConteoOcultoCambiado = namedtuple('ConteoOcultoCambiado', 'version monton conteo')
+CartaActualCambiada = namedtuple('CartaActualCambiada', 'version carta')
+RevelacionPendienteCambiada = namedtuple('RevelacionPendienteCambiada', 'version monton')
+JuegoTerminado = namedtuple('JuegoTerminado', 'version resultado')
+
+
+def barajado_riffle(mazo, generador=random, punto_corte=None, variacion_corte=5, bloque_maximo=3):
+    # Un corte y una mezcla irregular, como al barajar a mano.
+    # generador permite usar otra fuente de azar; punto_corte fija el corte
+    total_cartas = len(mazo)
+    mitad = total_cartas // 2
+    if punto_corte is None:
+        variacion = generador.randint(-variacion_corte, variacion_corte)
+        punto_corte = mitad + variacion
+
+    # Paso 1: Cortar el mazo
+    mitad1 = mazo[:punto_corte]
+    mitad2 = mazo[punto_corte:]
+    
+    # Paso 2: Combinar de forma irregular
+    mazo_barajado = []
+    i, j = 0, 0  # Índices para cada mitad
+    
+    while i < len(mitad1) and j < len(mitad2):
+        # Decidir cuántas cartas tomar de cada mitad (1 a bloque_maximo, 3 por defecto)
+        cartas_mitad1 = generador.randint(1, bloque_maximo)
+        cartas_mitad2 = generador.randint(1, bloque_maximo)
+        
+        # Tomar cartas de la mitad 1
+        for _ in range(cartas_mitad1):
+            if i < len(mitad1):
+                mazo_barajado.append(mitad1[i])
+                i += 1
+        
+        # Tomar cartas de la mitad 2
+        for _ in range(cartas_mitad2):
+            if j < len(mitad2):
+                mazo_barajado.append(mitad2[j])
+                j += 1
+    
+    #agrega las que queden
+    while i < len(mitad1):
+        mazo_barajado.append(mitad1[i])
+        i += 1
+    while j < len(mitad2):
+        mazo_barajado.append(mitad2[j])
+        j += 1
+    
+    return mazo_barajado
+
+
 class ModeloJuego:
   
     
@@ -20,6 +76,41 @@ class ModeloJuego:
         self.mensaje_ultimo_movimiento = ""
         self.revelacion_pendiente = None
         self.ultimo_movimiento_desde = None
+        self.version = 0
+        self.oyentes = []
+        self._cambios = []
+
+    def suscribir(self, oyente):
+        # oyente(cambios) recibe la lista de eventos de cada acción
+        self.oyentes.append(oyente)
+
+    def desuscribir(self, oyente):
+        if oyente in self.oyentes:
+            self.oyentes.remove(oyente)
+
+    def _emitir(self, tipo_evento, *datos):
+        # La versión sube siempre; el evento solo se crea si alguien escucha.
+        # Los pasos de juego comprueban self.oyentes antes de llamar aquí y,
+        # sin oyentes, solo suman a self.version (camino de las simulaciones)
+        self.version += 1
+        if self.oyentes:
+            self._cambios.append(tipo_evento(self.version, *datos))
+
+    def _publicar(self):
+        # Enviar a los oyentes los eventos acumulados durante la acción
+        if not self._cambios:
+            return
+        cambios, self._cambios = self._cambios, []
+        for oyente in list(self.oyentes):
+            oyente(cambios)
+
+    def terminar_juego(self):
+        # Terminar la partida desde fuera (p. ej. al abandonarla) avisando a los oyentes
+        if self.juego_terminado:
+            return
+        self.juego_terminado = True
+        self._emitir(JuegoTerminado, self.verificar_estado_juego() if self.oyentes else None)
+        self._publicar()
 
     def barajar_y_repartir(self):
         #Crea baraja 
@@ -29,7 +120,12 @@ class ModeloJuego:
         # return
         
         self._barajado_riffle()
-        
+        self.repartir_mazo(self.mazo)
+
+    def repartir_mazo(self, mazo):
+        # Repartir un mazo ya ordenado (útil para repetir una partida)
+        self.mazo = list(mazo)
+
         # Iniac montones va
         self.montones_ocultos = {i: [] for i in range(1, 14)}
         
@@ -52,49 +148,15 @@ class ModeloJuego:
             self.mensaje_ultimo_movimiento = "¿Voy a pasar Análisis Numérico?"
             
         self.juego_terminado = False
+        if self.oyentes:
+            conteos = {i: len(self.montones_ocultos[i]) for i in range(1, 14)}
+            self._emitir(TableroRepartido, dict(self.montones_visibles), conteos, self.carta_actual)
+            self._publicar()
+        else:
+            self.version += 1
 
     def _barajado_riffle(self):
-       
-        total_cartas = len(self.mazo)
-       
-        mitad = total_cartas // 2
-        variacion = random.randint(-5, 5)
-        punto_corte = mitad + variacion
-        
-      
-        mitad1 = self.mazo[:punto_corte]
-        mitad2 = self.mazo[punto_corte:]
-        
-        # Paso 2: Combinar de forma irregular
-        mazo_barajado = []
-        i, j = 0, 0  # Índices para cada mitad
-        
-        while i < len(mitad1) and j < len(mitad2):
-            # Decidir cuántas cartas tomar de cada mitad (1-3 cartas)
-            cartas_mitad1 = random.randint(1, 3)
-            cartas_mitad2 = random.randint(1, 3)
-            
-            # Tomar cartas de la mitad 1
-            for _ in range(cartas_mitad1):
-                if i < len(mitad1):
-                    mazo_barajado.append(mitad1[i])
-                    i += 1
-            
-            # Tomar cartas de la mitad 2
-            for _ in range(cartas_mitad2):
-                if j < len(mitad2):
-                    mazo_barajado.append(mitad2[j])
-                    j += 1
-        
-        #agrega las que queden
-        while i < len(mitad1):
-            mazo_barajado.append(mitad1[i])
-            i += 1
-        while j < len(mitad2):
-            mazo_barajado.append(mitad2[j])
-            j += 1
-        
-        self.mazo = mazo_barajado
+        self.mazo = barajado_riffle(self.mazo)
 
     def obtener_destino_carta(self, carta):
         if not carta or carta == 'back':
@@ -120,12 +182,26 @@ class ModeloJuego:
             self.carta_actual = self.montones_ocultos[destino].pop(0)
             # self.mensaje_ultimo_movimiento = f"Movió {carta_a_mover} al montón {destino}. Nueva carta: {self.carta_actual}"
             self.mensaje_ultimo_movimiento = "¿Voy a pasar Análisis Numérico?"
+            if self.oyentes:
+                self._emitir(CartaColocada, destino, carta_a_mover)
+                self._emitir(ConteoOcultoCambiado, destino, len(self.montones_ocultos[destino]))
+                self._emitir(CartaActualCambiada, self.carta_actual)
+                self._publicar()
+            else:
+                self.version += 3
             return True, self.mensaje_ultimo_movimiento
         else:
             self.carta_actual = None
             self.juego_terminado = True
             # self.mensaje_ultimo_movimiento = f"Movió {carta_a_mover} al montón {destino}. No hay más cartas. Fin del juego."
             self.mensaje_ultimo_movimiento = "¿Voy a pasar Análisis Numérico?"
+            if self.oyentes:
+                self._emitir(CartaColocada, destino, carta_a_mover)
+                self._emitir(CartaActualCambiada, None)
+                self._emitir(JuegoTerminado, self.verificar_estado_juego())
+                self._publicar()
+            else:
+                self.version += 3
             return False, self.mensaje_ultimo_movimiento
             
     def revelar_siguiente_carta(self, indice_monton):
@@ -136,12 +212,27 @@ class ModeloJuego:
             self.revelacion_pendiente = None
             # self.mensaje_ultimo_movimiento = f"Nueva carta revelada: {carta}"
             self.mensaje_ultimo_movimiento = "¿Voy a pasar Análisis Numérico?"
+            if self.oyentes:
+                self._emitir(ConteoOcultoCambiado, indice_monton, len(self.montones_ocultos[indice_monton]))
+                self._emitir(CartaActualCambiada, carta)
+                self._emitir(RevelacionPendienteCambiada, None)
+                self._publicar()
+            else:
+                self.version += 3
             return carta
         else:
+            habia_carta = self.carta_actual is not None
             self.carta_actual = None
             self.juego_terminado = True
             # self.mensaje_ultimo_movimiento = f"No hay más cartas en el montón {indice_monton}. Fin del juego."
             self.mensaje_ultimo_movimiento = "¿Voy a pasar Análisis Numérico?"
+            if self.oyentes:
+                if habia_carta:
+                    self._emitir(CartaActualCambiada, None)
+                self._emitir(JuegoTerminado, self.verificar_estado_juego())
+                self._publicar()
+            else:
+                self.version += 2 if habia_carta else 1
             return None
 
     def ejecutar_paso_manual(self, monton_clickeado):
@@ -160,6 +251,13 @@ class ModeloJuego:
             # Preparar revelación desde el mismo montón
             self.revelacion_pendiente = destino_esperado
             self.carta_actual = None
+            if self.oyentes:
+                self._emitir(CartaColocada, destino_esperado, carta_a_mover)
+                self._emitir(CartaActualCambiada, None)
+                self._emitir(RevelacionPendienteCambiada, destino_esperado)
+                self._publicar()
+            else:
+                self.version += 3
             
             mensaje = f"Carta {carta_a_mover} colocada en montón {destino_esperado}. Haz clic en el montón {destino_esperado} para revelar la siguiente."
             return True, mensaje
@@ -242,6 +340,8 @@ class ModeloJuego:
         self.mensaje_ultimo_movimiento = ""
         self.revelacion_pendiente = None
         self.ultimo_movimiento_desde = None
+        self._emitir(TableroReiniciado)
+        self._publicar()
     
     def _ordenar_para_ganar(self):
         
@@ -0,0 +1,351 @@
+# gamemontecarlo.py - Estimadores de Monte Carlo con reducción de varianza
+#
+# Para estimar la probabilidad de victoria (o comparar barajados) con menos
+# partidas que repetir barajar_y_repartir: estratos por punto de corte,
+# números aleatorios comunes, pares antitéticos y variables de control.
+
+import math
+import random
+import sys
+from collections import namedtuple
+
+from gamemodel import ModeloJuego, VALORES, PALOS, barajado_riffle
+from gamestats import Proporcion, Z_95, jugar_automatico
+
+MAZO_ORDENADO = [f"{valor}{palo}" for valor in VALORES for palo in PALOS]
+PROBABILIDAD_UNIFORME = 1 / 13  # Victoria con un mazo uniforme (resultado cerrado)
+FRACCION_PILOTO = 0.1
+MINIMO_POR_ESTRATO = 30
+RONDAS_CONTROL = 10
+TOLERANCIA_CONTROL = 1e-9
+
+# Variable de control: funcion(generador) con media conocida de antemano
+Control = namedtuple('Control', 'nombre funcion media')
+
+
+class GeneradorComun:
+    # Fuente de azar para números aleatorios comunes: cada decisión consume
+    # exactamente un uniforme, así dos barajados con la misma semilla usan los
+    # mismos números. Con antitetico=True devuelve 1 - u (par antitético).
+
+    def __init__(self, semilla, antitetico=False):
+        self._azar = random.Random(semilla)
+        self.antitetico = antitetico
+        self._uniformes = []
+        self._posicion = 0
+
+    def uniforme(self, indice):
+        # Uniforme número indice del flujo, sin avanzar la posición
+        while len(self._uniformes) <= indice:
+            self._uniformes.append(self._azar.random())
+        u = self._uniformes[indice]
+        return 1.0 - u if self.antitetico else u
+
+    def random(self):
+        u = self.uniforme(self._posicion)
+        self._posicion += 1
+        return u
+
+    def randint(self, a, b):
+        # Inversa de la distribución uniforme discreta (un solo uniforme)
+        return a + min(int(self.random() * (b - a + 1)), b - a)
+
+
+class VarianteBarajado:
+    # Una o varias pasadas de riffle con parámetros propios
+
+    def __init__(self, nombre, pasadas=1, variacion_corte=5, bloque_maximo=3):
+        self.nombre = nombre
+        self.pasadas = pasadas
+        self.variacion_corte = variacion_corte
+        self.bloque_maximo = bloque_maximo
+
+    def cortes(self):
+        # Estratos: todos los cortes de la primera pasada son igual de probables
+        mitad = len(MAZO_ORDENADO) // 2
+        return list(range(mitad - self.variacion_corte, mitad + self.variacion_corte + 1))
+
+    def barajar(self, generador, punto_corte=None):
+        mazo = list(MAZO_ORDENADO)
+        for pasada in range(self.pasadas):
+            corte = punto_corte if pasada == 0 else None
+            if corte is not None:
+                # Gastar el uniforme del corte para no desalinear el resto del flujo
+                generador.random()
+            mazo = barajado_riffle(mazo, generador, corte, self.variacion_corte, self.bloque_maximo)
+        return mazo
+
+
+class BarajadoUniforme:
+    # Fisher-Yates: todas las permutaciones igual de probables
+
+    def __init__(self, nombre="uniforme"):
+        self.nombre = nombre
+
+    def cortes(self):
+        return [None]
+
+    def barajar(self, generador, punto_corte=None):
+        mazo = list(MAZO_ORDENADO)
+        for i in range(len(mazo) - 1, 0, -1):
+            j = generador.randint(0, i)
+            mazo[i], mazo[j] = mazo[j], mazo[i]
+        return mazo
+
+
+RIFFLE = VarianteBarajado("riffle")
+RIFFLE_CORTE_AMPLIO = VarianteBarajado("riffle ±6", variacion_corte=6)
+RIFFLE_DOBLE = VarianteBarajado("doble riffle", pasadas=2)
+UNIFORME = BarajadoUniforme()
+
+
+def _control_corte(generador):
+    # Primer uniforme: decide el corte de la primera pasada
+    return generador.uniforme(0)
+
+
+def _control_desbalance(generador):
+    # Bloques de la mitad 1 menos bloques de la mitad 2 en las primeras rondas
+    return sum(generador.uniforme(1 + 2 * ronda) - generador.uniforme(2 + 2 * ronda)
+               for ronda in range(RONDAS_CONTROL))
+
+
+CONTROL_CORTE = Control("corte", _control_corte, 0.5)
+CONTROL_DESBALANCE = Control("desbalance", _control_desbalance, 0.0)
+CONTROLES_RIFFLE = (CONTROL_CORTE, CONTROL_DESBALANCE)
+
+
+class RegresionControles:
+    # Media de y corregida con variables de control de media conocida
+    # (regresión lineal sobre los controles); sin controles es la media simple
+
+    def __init__(self, medias):
+        self.medias = list(medias)
+        k = len(self.medias)
+        self.n = 0
+        self.suma_y = 0.0
+        self.suma_yy = 0.0
+        self.suma_x = [0.0] * k
+        self.suma_xy = [0.0] * k
+        self.suma_xx = [[0.0] * k for _ in range(k)]
+
+    def agregar(self, y, controles):
+        self.n += 1
+        self.suma_y += y
+        self.suma_yy += y * y
+        for a, xa in enumerate(controles):
+            self.suma_x[a] += xa
+            self.suma_xy[a] += xa * y
+            fila = self.suma_xx[a]
+            for b, xb in enumerate(controles):
+                fila[b] += xa * xb
+
+    def coeficientes(self):
+        # Resolver Sxx · beta = Sxy con sumas centradas (Gauss-Jordan);
+        # los controles constantes o redundantes quedan con beta = 0
+        k = len(self.medias)
+        beta = [0.0] * k
+        if self.n <= k + 1:
+            return beta
+        n = self.n
+        matriz = [[self.suma_xx[a][b] - self.suma_x[a] * self.suma_x[b] / n for b in range(k)]
+                  + [self.suma_xy[a] - self.suma_x[a] * self.suma_y / n] for a in range(k)]
+        diagonal = [matriz[a][a] for a in range(k)]
+        usados = []
+        for j in range(k):
+            if matriz[j][j] <= TOLERANCIA_CONTROL * diagonal[j] or matriz[j][j] <= 0:
+                continue
+            for i in range(k):
+                if i != j and matriz[i][j]:
+                    factor = matriz[i][j] / matriz[j][j]
+                    for columna in range(j, k + 1):
+                        matriz[i][columna] -= factor * matriz[j][columna]
+            usados.append(j)
+        for j in usados:
+            beta[j] = matriz[j][k] / matriz[j][j]
+        return beta
+
+    def estimacion(self):
+        if self.n == 0:
+            return 0.0
+        beta = self.coeficientes()
+        return self.suma_y / self.n - sum(
+            b * (suma / self.n - media) for b, suma, media in zip(beta, self.suma_x, self.medias))
+
+    def varianza_residual(self):
+        # Varianza de y que los controles no explican
+        if self.n < 2:
+            return 0.0
+        beta = self.coeficientes()
+        usados = sum(1 for b in beta if b)
+        suma_cuadrados = self.suma_yy - self.suma_y ** 2 / self.n
+        for b, suma, suma_xy in zip(beta, self.suma_x, self.suma_xy):
+            suma_cuadrados -= b * (suma_xy - suma * self.suma_y / self.n)
+        grados = self.n - 1 - usados
+        return max(0.0, suma_cuadrados) / grados if grados > 0 else 0.0
+
+
+class Estimacion:
+    # Valor estimado, varianza del estimador y partidas que costó.
+    # varianza_simple es la varianza por partida del muestreo simple
+    # equivalente, para calcular la muestra efectiva y la aceleración
+
+    def __init__(self, metodo, valor, varianza, partidas, varianza_simple):
+        self.metodo = metodo
+        self.valor = valor
+        self.varianza = varianza
+        self.partidas = partidas
+        self.varianza_simple = varianza_simple
+
+    def error_estandar(self):
+        return math.sqrt(self.varianza)
+
+    def intervalo(self, z=Z_95):
+        margen = z * self.error_estandar()
+        return self.valor - margen, self.valor + margen
+
+    def muestra_efectiva(self):
+        # Partidas de muestreo simple que darían la misma varianza
+        if self.varianza <= 0:
+            return math.inf
+        return self.varianza_simple / self.varianza
+
+    def aceleracion(self):
+        return self.muestra_efectiva() / self.partidas if self.partidas else 0.0
+
+    def resumen(self):
+        return (f"{self.metodo:<44} {self.valor:+.4f} ± {Z_95 * self.error_estandar():.4f}  "
+                f"partidas {self.partidas:>7}  muestra efectiva {self.muestra_efectiva():>9.0f}  "
+                f"aceleración {self.aceleracion():6.2f}x")
+
+
+def jugar_mazo(mazo, modelo):
+    # 1 si el reparto gana jugando en automático, 0 si pierde
+    modelo.repartir_mazo(mazo)
+    return 1 if jugar_automatico(modelo)[0] else 0
+
+
+def _generadores(semilla, antitetico):
+    if antitetico:
+        return [GeneradorComun(semilla), GeneradorComun(semilla, antitetico=True)]
+    return [GeneradorComun(semilla)]
+
+
+def _nombre_metodo(base, estratificar=False, antitetico=False, controles=()):
+    partes = [base]
+    if estratificar:
+        partes.append("estratos")
+    if antitetico:
+        partes.append("antitético")
+    if controles:
+        partes.append("control")
+    return " + ".join(partes)
+
+
+def _muestrear(observar, estratos, observaciones, semilla, medias, fraccion_piloto):
+    # Estratos de igual peso; con más de uno, piloto y reparto de Neyman
+    regresiones = {estrato: RegresionControles(medias) for estrato in estratos}
+
+    def muestrear(estrato, cantidad):
+        regresion = regresiones[estrato]
+        for _ in range(cantidad):
+            y, controles = observar(f"{semilla}-{estrato}-{regresion.n}", estrato)
+            regresion.agregar(y, controles)
+
+    if len(estratos) == 1:
+        muestrear(estratos[0], observaciones)
+    else:
+        piloto = max(MINIMO_POR_ESTRATO, int(observaciones * fraccion_piloto / len(estratos)))
+        for estrato in estratos:
+            muestrear(estrato, piloto)
+        # Más observaciones donde el resultado varía más
+        desviaciones = [math.sqrt(regresiones[estrato].varianza_residual()) for estrato in estratos]
+        total = sum(desviaciones)
+        for estrato, desviacion in zip(estratos, desviaciones):
+            objetivo = observaciones * desviacion / total if total else observaciones / len(estratos)
+            muestrear(estrato, max(0, round(objetivo) - piloto))
+
+    peso = 1 / len(estratos)
+    valor = sum(peso * regresion.estimacion() for regresion in regresiones.values())
+    varianza = sum(peso * peso * regresion.varianza_residual() / regresion.n
+                   for regresion in regresiones.values())
+    return valor, varianza, sum(regresion.n for regresion in regresiones.values())
+
+
+def estimar_victoria(variante=RIFFLE, partidas=20000, semilla=0, estratificar=False,
+                     antitetico=False, controles=(), fraccion_piloto=FRACCION_PILOTO):
+    # Probabilidad de victoria de un barajado con las técnicas elegidas
+    modelo = ModeloJuego()
+    partidas_por_observacion = 2 if antitetico else 1
+
+    def observar(semilla_observacion, punto_corte):
+        generadores = _generadores(semilla_observacion, antitetico)
+        victorias = [jugar_mazo(variante.barajar(generador, punto_corte), modelo)
+                     for generador in generadores]
+        valores_control = [sum(control.funcion(generador) for generador in generadores) / len(generadores)
+                           for control in controles]
+        return sum(victorias) / len(victorias), valores_control
+
+    estratos = variante.cortes() if estratificar else [None]
+    valor, varianza, observaciones = _muestrear(
+        observar, estratos, partidas // partidas_por_observacion, semilla,
+        [control.media for control in controles], fraccion_piloto)
+    metodo = _nombre_metodo(variante.nombre, estratificar and len(estratos) > 1, antitetico, controles)
+    return Estimacion(metodo, valor, varianza, observaciones * partidas_por_observacion,
+                      valor * (1 - valor))
+
+
+def comparar_variantes(variante_a, variante_b, partidas=20000, semilla=0, comunes=True,
+                       antitetico=False, controles=()):
+    # Diferencia de probabilidad de victoria (a - b). Con comunes=True las dos
+    # variantes juegan con los mismos números aleatorios en cada observación
+    modelo = ModeloJuego()
+    victorias_a = Proporcion()
+    victorias_b = Proporcion()
+    partidas_por_observacion = 2 * (2 if antitetico else 1)
+
+    def observar(semilla_observacion, punto_corte):
+        semilla_a = semilla_b = semilla_observacion
+        if not comunes:
+            semilla_a, semilla_b = f"{semilla_observacion}/a", f"{semilla_observacion}/b"
+        generadores_a = _generadores(semilla_a, antitetico)
+        diferencias = []
+        for generador_a, generador_b in zip(generadores_a, _generadores(semilla_b, antitetico)):
+            gana_a = jugar_mazo(variante_a.barajar(generador_a), modelo)
+            gana_b = jugar_mazo(variante_b.barajar(generador_b), modelo)
+            victorias_a.agregar(gana_a)
+            victorias_b.agregar(gana_b)
+            diferencias.append(gana_a - gana_b)
+        valores_control = [sum(control.funcion(generador) for generador in generadores_a) / len(generadores_a)
+                           for control in controles]
+        return sum(diferencias) / len(diferencias), valores_control
+
+    valor, varianza, observaciones = _muestrear(
+        observar, [None], partidas // partidas_por_observacion, semilla,
+        [control.media for control in controles], FRACCION_PILOTO)
+    p_a, p_b = victorias_a.estimacion(), victorias_b.estimacion()
+    base = f"{variante_a.nombre} - {variante_b.nombre}" + (" (comunes)" if comunes else "")
+    return Estimacion(_nombre_metodo(base, False, antitetico, controles), valor, varianza,
+                      observaciones * partidas_por_observacion,
+                      2 * (p_a * (1 - p_a) + p_b * (1 - p_b)))
+
+
+if __name__ == "__main__":
+    # Uso: python gamemontecarlo.py [partidas por estimador]
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    print(f"Probabilidad de victoria con {RIFFLE.nombre}:")
+    for opciones in ({}, {'antitetico': True}, {'controles': CONTROLES_RIFFLE},
+                     {'estratificar': True}, {'estratificar': True, 'controles': CONTROLES_RIFFLE}):
+        print("  " + estimar_victoria(RIFFLE, partidas, **opciones).resumen())
+
+    print(f"\nDiferencia entre {RIFFLE.nombre} y {RIFFLE_CORTE_AMPLIO.nombre}:")
+    for opciones in ({'comunes': False}, {}, {'controles': CONTROLES_RIFFLE}):
+        print("  " + comparar_variantes(RIFFLE, RIFFLE_CORTE_AMPLIO, partidas, **opciones).resumen())
+
+    # Comprobación con el resultado cerrado del mazo uniforme
+    uniforme = estimar_victoria(UNIFORME, partidas)
+    inferior, superior = uniforme.intervalo()
+    cubre = "dentro" if inferior <= PROBABILIDAD_UNIFORME <= superior else "FUERA"
+    print(f"\nMazo uniforme: {uniforme.valor:.4f}, IC95% [{inferior:.4f}, {superior:.4f}]; "
+          f"1/13 = {PROBABILIDAD_UNIFORME:.4f} queda {cubre} del intervalo")
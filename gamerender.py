@@ -0,0 +1,340 @@
+# gamerender.py - Exportar partidas automáticas como animaciones (sin ventana)
+
+import io
+import os
+import random
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageDraw, ImageFont
+
+from assets import GestorRecursos
+from gamemodel import ModeloJuego, VALORES
+from gamelayout import (ANCHO_CARTA, ALTO_CARTA, ANCHO_CANVAS, ALTO_CANVAS,
+                        DESPLAZAMIENTO_MONTON_X, DESPLAZAMIENTO_MONTON_Y, RADIO_RELOJ,
+                        calcular_posiciones_montones)
+
+# Colores y medidas de los fotogramas (mismos que el lienzo de VistaJuego)
+COLOR_FONDO = (0, 100, 0)
+MAX_CARTAS_APILADAS = 5
+ALTO_LINEA_ESTADO = 40
+DURACION_FOTOGRAMA_MS = 300
+FUENTES_TTF = ("DejaVuSans-Bold.ttf", "arialbd.ttf", "Arial Bold.ttf")
+
+
+def repetir_partida_automatica(semilla=None, modelo=None):
+    # Jugar una partida automática y devolver una foto del tablero tras cada paso
+    if modelo is None:
+        if semilla is not None:
+            random.seed(semilla)
+        modelo = ModeloJuego()
+        modelo.modo_juego = 'auto'
+        modelo.barajar_y_repartir()
+
+    estados = [_copiar_estado(modelo.obtener_estado_tablero())]
+    while modelo.carta_actual:
+        modelo.ejecutar_paso_automatico()
+        estados.append(_copiar_estado(modelo.obtener_estado_tablero()))
+    return estados
+
+
+def _copiar_estado(estado_tablero):
+    # obtener_estado_tablero comparte los montones visibles con el modelo
+    copia = dict(estado_tablero)
+    copia['visible'] = dict(estado_tablero['visible'])
+    return copia
+
+
+def _cargar_fuente(tamano):
+    # Fuente TrueType si hay alguna instalada; si no, la de Pillow
+    for nombre in FUENTES_TTF:
+        try:
+            return ImageFont.truetype(nombre, tamano)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size=tamano)
+    except TypeError:
+        return ImageFont.load_default()
+
+
+def _texto_centrado(dibujo, centro, texto, fuente, color):
+    # Centrar con textbbox (anchor no funciona con las fuentes de mapa de bits)
+    izquierda, arriba, derecha, abajo = dibujo.textbbox((0, 0), texto, font=fuente)
+    posicion = (centro[0] - (izquierda + derecha) / 2, centro[1] - (arriba + abajo) / 2)
+    dibujo.text(posicion, texto, fill=color, font=fuente)
+
+
+def cargar_imagenes_escaladas(escala=1.0, reverso=None, recursos=None):
+    # Cartas y reverso en RGBA al tamaño de la escala, listas para pegar
+    recursos = recursos or GestorRecursos()
+    if reverso:
+        recursos.cambiar_reverso(reverso)
+    tamano = (round(ANCHO_CARTA * escala), round(ALTO_CARTA * escala))
+    imagenes = {}
+    for nombre in recursos.archivos:
+        if not nombre.startswith('back'):
+            imagenes[nombre] = recursos.obtener_imagen_pil(nombre, tamano).convert('RGBA')
+    imagenes['back'] = recursos.obtener_imagen_pil('back', tamano).convert('RGBA')
+    return imagenes
+
+
+class RenderizadorTablero:
+    # Dibuja fotogramas del tablero con Pillow, redibujando solo lo que cambia
+
+    def __init__(self, recursos=None, escala=1.0, reverso=None, imagenes=None):
+        # imagenes: cartas ya escaladas (p. ej. las que reciben los procesos trabajadores)
+        self.escala = escala
+        self.ancho = round(ANCHO_CANVAS * escala)
+        self.alto = round(ALTO_CANVAS * escala)
+        self.ancho_carta = round(ANCHO_CARTA * escala)
+        self.alto_carta = round(ALTO_CARTA * escala)
+        self.posiciones_montones = calcular_posiciones_montones(
+            self.ancho, self.alto, self.ancho_carta, self.alto_carta, RADIO_RELOJ * escala)
+        self.fuente_numero = _cargar_fuente(max(6, round(12 * escala)))
+        self.fuente_conteo = _cargar_fuente(max(6, round(10 * escala)))
+        self.fuente_estado = _cargar_fuente(max(6, round(12 * escala)))
+
+        if imagenes is None:
+            imagenes = cargar_imagenes_escaladas(escala, reverso, recursos)
+        self.imagenes = imagenes
+
+        self.cajas_montones = {i: self._caja_monton(i) for i in range(1, 14)}
+        self.caja_estado = (0, self.alto - round(ALTO_LINEA_ESTADO * escala), self.ancho, self.alto)
+        self.fondo = self._dibujar_fondo()
+
+    def _px(self, medida):
+        return round(medida * self.escala)
+
+    def _caja_monton(self, indice_monton):
+        # Rectángulo que puede ocupar un montón: pila, resaltado y número
+        x, y = self.posiciones_montones[indice_monton]
+        apilado_x = self._px(DESPLAZAMIENTO_MONTON_X) * (MAX_CARTAS_APILADAS - 1)
+        apilado_y = self._px(DESPLAZAMIENTO_MONTON_Y) * (MAX_CARTAS_APILADAS - 1)
+        margen = self._px(10)
+        arriba = max(apilado_y + margen, self._px(30))
+        return (max(0, int(x - apilado_x - margen)), max(0, int(y - arriba)),
+                min(self.ancho, int(x + self.ancho_carta + margen) + 1),
+                min(self.alto, int(y + self.alto_carta + margen) + 1))
+
+    def _dibujar_fondo(self):
+        # Tapete vacío, se crea una sola vez y se recorta para cada región
+        return Image.new('RGB', (self.ancho, self.alto), COLOR_FONDO)
+
+    def _firma_monton(self, estado_tablero, indice_monton):
+        # Todo lo que influye en cómo se ve un montón
+        destino = _destino_carta(estado_tablero.get('carta_actual'))
+        return (estado_tablero['visible'].get(indice_monton, 'back'),
+                estado_tablero['conteos_ocultos'].get(indice_monton, 0),
+                estado_tablero.get('revelacion_pendiente') == indice_monton,
+                destino == indice_monton)
+
+    def _dibujar_monton(self, lienzo, dibujo, firma, indice_monton, desplazamiento):
+        # Dibujar un montón igual que VistaJuego.dibujar_tablero
+        nombre_carta, ocultas, pendiente, es_destino = firma
+        x, y = self.posiciones_montones[indice_monton]
+        x, y = round(x) - desplazamiento[0], round(y) - desplazamiento[1]
+        ancho, alto = self.ancho_carta, self.alto_carta
+
+        if pendiente:
+            margen = self._px(8)
+            dibujo.rectangle((x - margen, y - margen, x + ancho + margen, y + alto + margen),
+                             outline="lime", width=max(1, self._px(5)))
+        elif es_destino:
+            margen = self._px(6)
+            dibujo.rectangle((x - margen, y - margen, x + ancho + margen, y + alto + margen),
+                             outline="orange", width=max(1, self._px(3)))
+
+        if ocultas > 0:
+            reverso = self.imagenes['back']
+            for j in range(min(ocultas, MAX_CARTAS_APILADAS)):
+                lienzo.paste(reverso, (x - j * self._px(DESPLAZAMIENTO_MONTON_X),
+                                       y - j * self._px(DESPLAZAMIENTO_MONTON_Y)), reverso)
+            if ocultas > 1:
+                _texto_centrado(dibujo, (x + ancho - self._px(10), y + self._px(10)),
+                                str(ocultas), self.fuente_conteo, "yellow")
+
+        if nombre_carta != 'back':
+            imagen = self.imagenes.get(nombre_carta)
+            if imagen:
+                lienzo.paste(imagen, (x, y), imagen)
+        elif ocultas == 0:
+            self._rectangulo_discontinuo(dibujo, (x, y, x + ancho, y + alto))
+
+        _texto_centrado(dibujo, (x + ancho / 2, y - self._px(15)),
+                        str(indice_monton), self.fuente_numero, "white")
+
+    def _rectangulo_discontinuo(self, dibujo, caja, trazo=5):
+        # Pillow no tiene bordes discontinuos: se dibujan tramo a tramo
+        x0, y0, x1, y1 = caja
+        for inicio in range(x0, x1, 2 * trazo):
+            fin = min(inicio + trazo, x1)
+            dibujo.line((inicio, y0, fin, y0), fill="gray")
+            dibujo.line((inicio, y1, fin, y1), fill="gray")
+        for inicio in range(y0, y1, 2 * trazo):
+            fin = min(inicio + trazo, y1)
+            dibujo.line((x0, inicio, x0, fin), fill="gray")
+            dibujo.line((x1, inicio, x1, fin), fill="gray")
+
+    def _texto_estado(self, estado_tablero):
+        carta_actual = estado_tablero.get('carta_actual')
+        if carta_actual:
+            destino = _destino_carta(carta_actual)
+            return f"Carta Actual: {carta_actual} → Montón {destino}"
+        return "No hay carta actual"
+
+    def _componer_region(self, fotograma, caja, firmas, estado_tablero):
+        # Rehacer una región desde el fondo con todo lo que la toca
+        region = self.fondo.crop(caja)
+        dibujo = ImageDraw.Draw(region)
+        desplazamiento = (caja[0], caja[1])
+        for i in range(1, 14):
+            if _se_solapan(caja, self.cajas_montones[i]):
+                self._dibujar_monton(region, dibujo, firmas[i], i, desplazamiento)
+        if _se_solapan(caja, self.caja_estado):
+            centro_y = (self.caja_estado[1] + self.caja_estado[3]) / 2 - caja[1]
+            _texto_centrado(dibujo, (self.ancho / 2 - caja[0], centro_y),
+                            self._texto_estado(estado_tablero), self.fuente_estado, "yellow")
+        fotograma.paste(region, caja[:2])
+
+    def renderizar(self, estados):
+        # Generar un fotograma por estado; solo se redibujan las regiones sucias
+        fotograma = None
+        firmas_previas = None
+        texto_previo = None
+        for estado_tablero in estados:
+            firmas = {i: self._firma_monton(estado_tablero, i) for i in range(1, 14)}
+            texto = self._texto_estado(estado_tablero)
+            if fotograma is None:
+                fotograma = self.fondo.copy()
+                cajas_sucias = [(0, 0, self.ancho, self.alto)]
+            else:
+                fotograma = fotograma.copy()
+                cajas_sucias = [self.cajas_montones[i] for i in range(1, 14)
+                                if firmas[i] != firmas_previas[i]]
+                if texto != texto_previo:
+                    cajas_sucias.append(self.caja_estado)
+            for caja in cajas_sucias:
+                self._componer_region(fotograma, caja, firmas, estado_tablero)
+            firmas_previas, texto_previo = firmas, texto
+            yield fotograma
+
+
+def _destino_carta(carta):
+    return VALORES.index(carta[:-1]) + 1 if carta else None
+
+
+def _se_solapan(caja_a, caja_b):
+    return caja_a[0] < caja_b[2] and caja_b[0] < caja_a[2] and caja_a[1] < caja_b[3] and caja_b[1] < caja_a[3]
+
+
+# Un renderizador por proceso trabajador, creado una vez con las imágenes del padre
+_renderizador_proceso = None
+
+
+def _iniciar_trabajador(escala, imagenes):
+    global _renderizador_proceso
+    _renderizador_proceso = RenderizadorTablero(escala=escala, imagenes=imagenes)
+
+
+def _codificar_fotograma_gif(fotograma):
+    # Comprimir un fotograma (LZW) como imagen GIF suelta y devolver solo su
+    # bloque de imagen, con la paleta como tabla local, para poder concatenarlo
+    buffer = io.BytesIO()
+    fotograma.quantize(colors=255, method=Image.FASTOCTREE).save(buffer, format='GIF')
+    datos = buffer.getvalue()
+
+    banderas = datos[10]
+    posicion = 13
+    paleta = b""
+    bits_paleta = banderas & 0x07
+    if banderas & 0x80:
+        fin = posicion + 3 * (2 << bits_paleta)
+        paleta, posicion = datos[posicion:fin], fin
+    while datos[posicion] == 0x21:
+        # Saltar extensiones: etiqueta y subbloques hasta el terminador
+        posicion += 2
+        while datos[posicion]:
+            posicion += datos[posicion] + 1
+        posicion += 1
+
+    descriptor = bytearray(datos[posicion:posicion + 10])
+    posicion += 10
+    if descriptor[9] & 0x80:
+        bits_paleta = descriptor[9] & 0x07
+        fin = posicion + 3 * (2 << bits_paleta)
+        paleta, posicion = datos[posicion:fin], fin
+    inicio_imagen = posicion
+    posicion += 1  # tamaño mínimo de código LZW
+    while datos[posicion]:
+        posicion += datos[posicion] + 1
+    descriptor[9] = (descriptor[9] & 0x40) | 0x80 | bits_paleta
+    return bytes(descriptor) + paleta + datos[inicio_imagen:posicion + 1]
+
+
+def _unir_gif(fragmentos, tamano, duracion_ms):
+    # Cabecera, bucle infinito y un bloque de control + imagen por fotograma
+    partes = [b"GIF89a", struct.pack("<HHBBB", tamano[0], tamano[1], 0x70, 0, 0),
+              b"\x21\xff\x0bNETSCAPE2.0\x03\x01" + struct.pack("<H", 0) + b"\x00"]
+    control = b"\x21\xf9\x04\x04" + struct.pack("<H", round(duracion_ms / 10)) + b"\x00\x00"
+    for fragmento in fragmentos:
+        partes.append(control)
+        partes.append(fragmento)
+    partes.append(b"\x3b")
+    return b"".join(partes)
+
+
+def _procesar_tramo(estados, primer_indice, formato, carpeta):
+    # Trabajador: dibujar y codificar un tramo seguido de fotogramas
+    resultado = []
+    for desplazamiento, fotograma in enumerate(_renderizador_proceso.renderizar(estados)):
+        if formato == 'png':
+            ruta = os.path.join(carpeta, f"fotograma_{primer_indice + desplazamiento:03d}.png")
+            fotograma.save(ruta, compress_level=1)
+            resultado.append(ruta)
+        else:
+            resultado.append(_codificar_fotograma_gif(fotograma))
+    return resultado
+
+
+def exportar_partida(estados, destino, formato=None, procesos=None, escala=1.0, reverso=None,
+                     duracion_ms=DURACION_FOTOGRAMA_MS):
+    # Exportar los estados de una partida como GIF animado o como carpeta de PNG.
+    # Dibujo y codificación ocurren en los trabajadores; el padre solo une los bytes
+    formato = formato or ('gif' if destino.lower().endswith('.gif') else 'png')
+    if formato not in ('gif', 'png'):
+        raise ValueError(f"Formato no soportado: {formato}")
+    if not estados:
+        raise ValueError("No hay estados que exportar.")
+    if formato == 'png':
+        os.makedirs(destino, exist_ok=True)
+
+    procesos = max(1, min(procesos or os.cpu_count() or 1, len(estados)))
+    tamano_tramo = -(-len(estados) // procesos)
+    tramos = [(estados[inicio:inicio + tamano_tramo], inicio)
+              for inicio in range(0, len(estados), tamano_tramo)]
+
+    # Las imágenes se cargan y escalan una sola vez y se pasan a cada trabajador
+    imagenes = cargar_imagenes_escaladas(escala, reverso)
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_trabajador,
+                             initargs=(escala, imagenes)) as ejecutor:
+        futuros = [ejecutor.submit(_procesar_tramo, tramo, inicio, formato, destino)
+                   for tramo, inicio in tramos]
+        resultados = [salida for futuro in futuros for salida in futuro.result()]
+
+    if formato == 'gif':
+        tamano = (round(ANCHO_CANVAS * escala), round(ALTO_CANVAS * escala))
+        with open(destino, 'wb') as archivo:
+            archivo.write(_unir_gif(resultados, tamano, duracion_ms))
+        return destino
+    return resultados
+
+
+if __name__ == "__main__":
+    # Uso: python gamerender.py partida.gif [semilla]
+    destino = sys.argv[1] if len(sys.argv) > 1 else "partida.gif"
+    semilla = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    estados = repetir_partida_automatica(semilla=semilla)
+    exportar_partida(estados, destino)
+    print(f"Partida de {len(estados) - 1} movimientos exportada en {destino}")
@@ -0,0 +1,272 @@
+# gamestats.py - Estadísticas masivas del Solitario Reloj
+
+import itertools
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from gamemodel import ModeloJuego
+
+# Constantes del análisis
+TOTAL_CARTAS = 52
+Z_95 = 1.959963984540054
+INTERVALO_VERIFICACION = 1000
+TAMANO_LOTE = 20000
+
+
+class EstadisticaEnLinea:
+    # Media y varianza en una sola pasada (Welford), combinable entre procesos
+
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+
+    def agregar(self, valor):
+        # Incorporar un valor sin guardarlo
+        self.n += 1
+        delta = valor - self.media
+        self.media += delta / self.n
+        self.m2 += delta * (valor - self.media)
+
+    def combinar(self, otra):
+        # Unir el estado parcial de otro trabajador (Chan et al.)
+        if otra.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.media, self.m2 = otra.n, otra.media, otra.m2
+            return self
+        total = self.n + otra.n
+        delta = otra.media - self.media
+        self.media += delta * otra.n / total
+        self.m2 += otra.m2 + delta * delta * self.n * otra.n / total
+        self.n = total
+        return self
+
+    def varianza(self):
+        # Varianza muestral
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    def desviacion(self):
+        return math.sqrt(self.varianza())
+
+
+class Proporcion:
+    # Conteo de éxitos con intervalo de confianza de Wilson
+
+    def __init__(self):
+        self.exitos = 0
+        self.total = 0
+
+    def agregar(self, exito):
+        self.total += 1
+        if exito:
+            self.exitos += 1
+
+    def combinar(self, otra):
+        self.exitos += otra.exitos
+        self.total += otra.total
+        return self
+
+    def estimacion(self):
+        return self.exitos / self.total if self.total else 0.0
+
+    def intervalo_wilson(self, z=Z_95):
+        # Intervalo de Wilson, válido también con proporciones cercanas a 0
+        if self.total == 0:
+            return 0.0, 1.0
+        n = self.total
+        p = self.exitos / n
+        z2 = z * z
+        denominador = 1 + z2 / n
+        centro = (p + z2 / (2 * n)) / denominador
+        margen = z * math.sqrt(p * (1 - p) / n + z2 / (4 * n * n)) / denominador
+        return max(0.0, centro - margen), min(1.0, centro + margen)
+
+    def ancho_intervalo(self, z=Z_95):
+        inferior, superior = self.intervalo_wilson(z)
+        return superior - inferior
+
+
+class Histograma:
+    # Histograma de enteros con cajas fijas (memoria constante)
+
+    def __init__(self, minimo, maximo):
+        self.minimo = minimo
+        self.maximo = maximo
+        self.conteos = [0] * (maximo - minimo + 1)
+        self.por_debajo = 0
+        self.por_encima = 0
+
+    def agregar(self, valor):
+        if valor < self.minimo:
+            self.por_debajo += 1
+        elif valor > self.maximo:
+            self.por_encima += 1
+        else:
+            self.conteos[valor - self.minimo] += 1
+
+    def combinar(self, otro):
+        if (otro.minimo, otro.maximo) != (self.minimo, self.maximo):
+            raise ValueError("Los histogramas tienen cajas distintas.")
+        for i, conteo in enumerate(otro.conteos):
+            self.conteos[i] += conteo
+        self.por_debajo += otro.por_debajo
+        self.por_encima += otro.por_encima
+        return self
+
+    def total(self):
+        return sum(self.conteos) + self.por_debajo + self.por_encima
+
+
+class AgregadorPartidas:
+    # Resumen de muchas partidas: victorias, cartas reveladas y salida de los reyes
+
+    def __init__(self):
+        self.victorias = Proporcion()
+        self.cartas_reveladas = EstadisticaEnLinea()
+        self.histograma_reveladas = Histograma(1, TOTAL_CARTAS)
+        self.histograma_reyes = Histograma(1, TOTAL_CARTAS)
+        self.histograma_primer_rey = Histograma(1, TOTAL_CARTAS)
+
+    def agregar(self, resultado):
+        # resultado = (victoria, cartas_reveladas, movimientos_de_reyes)
+        victoria, reveladas, movimientos_reyes = resultado
+        self.victorias.agregar(victoria)
+        self.cartas_reveladas.agregar(reveladas)
+        self.histograma_reveladas.agregar(reveladas)
+        for movimiento in movimientos_reyes:
+            self.histograma_reyes.agregar(movimiento)
+        if movimientos_reyes:
+            self.histograma_primer_rey.agregar(movimientos_reyes[0])
+
+    def combinar(self, otro):
+        self.victorias.combinar(otro.victorias)
+        self.cartas_reveladas.combinar(otro.cartas_reveladas)
+        self.histograma_reveladas.combinar(otro.histograma_reveladas)
+        self.histograma_reyes.combinar(otro.histograma_reyes)
+        self.histograma_primer_rey.combinar(otro.histograma_primer_rey)
+        return self
+
+    def partidas(self):
+        return self.victorias.total
+
+    def resumen(self):
+        # Texto legible con los resultados principales
+        inferior, superior = self.victorias.intervalo_wilson()
+        return (f"Partidas: {self.partidas()}\n"
+                f"Victorias: {self.victorias.exitos} ({self.victorias.estimacion():.4%}) "
+                f"IC95% [{inferior:.4%}, {superior:.4%}]\n"
+                f"Cartas reveladas: media {self.cartas_reveladas.media:.3f}, "
+                f"desviación {self.cartas_reveladas.desviacion():.3f}")
+
+
+def fuente_repartos(total_partidas=None, modelo=None):
+    # Generar repartos barajados reutilizando un solo modelo
+    modelo = modelo or ModeloJuego()
+    contador = itertools.count() if total_partidas is None else range(total_partidas)
+    for _ in contador:
+        modelo.barajar_y_repartir()
+        yield modelo
+
+
+def jugar_automatico(modelo):
+    # Jugar un reparto hasta el final con las reglas del modelo
+    cartas_reveladas = 1
+    movimiento = 0
+    movimientos_reyes = []
+    while modelo.carta_actual:
+        movimiento += 1
+        if modelo.carta_actual[0] == 'K':
+            movimientos_reyes.append(movimiento)
+        continua, _ = modelo.ejecutar_paso_automatico()
+        if continua:
+            cartas_reveladas += 1
+    victoria = modelo.verificar_estado_juego() == 'victoria'
+    return victoria, cartas_reveladas, movimientos_reyes
+
+
+def evaluar_partidas(repartos):
+    # Convertir cada reparto en su resultado
+    for modelo in repartos:
+        yield jugar_automatico(modelo)
+
+
+def agregar_resultados(resultados, agregador=None, ancho_objetivo=None,
+                       intervalo_verificacion=INTERVALO_VERIFICACION):
+    # Consumir resultados; si hay ancho objetivo, parar al alcanzarlo
+    agregador = agregador or AgregadorPartidas()
+    for resultado in resultados:
+        agregador.agregar(resultado)
+        if (ancho_objetivo is not None
+                and agregador.partidas() % intervalo_verificacion == 0
+                and agregador.victorias.ancho_intervalo() <= ancho_objetivo):
+            break
+    return agregador
+
+
+def simular(total_partidas=None, ancho_objetivo=None, semilla=None):
+    # Ejecutar el pipeline completo en el proceso actual
+    if total_partidas is None and ancho_objetivo is None:
+        raise ValueError("Indica un total de partidas o un ancho objetivo.")
+    if semilla is not None:
+        random.seed(semilla)
+    resultados = evaluar_partidas(fuente_repartos(total_partidas))
+    return agregar_resultados(resultados, ancho_objetivo=ancho_objetivo)
+
+
+def _simular_lote(semilla, tamano):
+    # Trabajador: un lote con semilla propia, devuelve solo el estado parcial
+    return simular(total_partidas=tamano, semilla=semilla)
+
+
+def simular_en_paralelo(total_partidas=None, ancho_objetivo=None, semilla=0,
+                        procesos=None, tamano_lote=TAMANO_LOTE):
+    # Repartir lotes entre procesos y combinar sus estados parciales
+    if total_partidas is None and ancho_objetivo is None:
+        raise ValueError("Indica un total de partidas o un ancho objetivo.")
+    procesos = procesos or os.cpu_count() or 1
+    agregador = AgregadorPartidas()
+    indices_lote = itertools.count()
+    pendientes_por_enviar = total_partidas
+
+    def siguiente_lote():
+        nonlocal pendientes_por_enviar
+        if pendientes_por_enviar is None:
+            tamano = tamano_lote
+        else:
+            tamano = min(tamano_lote, pendientes_por_enviar)
+            pendientes_por_enviar -= tamano
+        return tamano
+
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        en_curso = set()
+
+        def enviar():
+            # Mantener a lo sumo dos lotes por proceso en vuelo
+            while len(en_curso) < 2 * procesos:
+                tamano = siguiente_lote()
+                if tamano <= 0:
+                    return
+                semilla_lote = f"{semilla}-{next(indices_lote)}"
+                en_curso.add(ejecutor.submit(_simular_lote, semilla_lote, tamano))
+
+        enviar()
+        while en_curso:
+            terminados, en_curso = wait(en_curso, return_when=FIRST_COMPLETED)
+            for futuro in terminados:
+                agregador.combinar(futuro.result())
+            if (ancho_objetivo is not None
+                    and agregador.victorias.ancho_intervalo() <= ancho_objetivo):
+                for futuro in en_curso:
+                    futuro.cancel()
+                break
+            enviar()
+    return agregador
+
+
+if __name__ == "__main__":
+    # Ejemplo: estimar la probabilidad de victoria con ±0.5%
+    resultado = simular_en_paralelo(ancho_objetivo=0.01)
+    print(resultado.resumen())
@@ -3,12 +3,16 @@
 import tkinter as tk
 from tkinter import messagebox
 import math
+from gamelayout import (ANCHO_CARTA, ALTO_CARTA, ANCHO_CANVAS, ALTO_CANVAS,
+                        DESPLAZAMIENTO_MONTON_X, DESPLAZAMIENTO_MONTON_Y, RADIO_RELOJ,
+                        calcular_posiciones_montones)
+from gamemodel import (TableroRepartido, CartaColocada, ConteoOcultoCambiado,
+                       CartaActualCambiada, RevelacionPendienteCambiada)
+
+# Medidas propias de la ventana
+ESPERA_REDIMENSIONADO_MS = 150
+PIXELES_POR_PUNTO = 96 / 72  # Tamaños de letra base pensados en puntos a 96 ppp
 
-# Constantes del juego
-ANCHO_CARTA, ALTO_CARTA = 75, 110
-ANCHO_CANVAS, ALTO_CANVAS = 800, 700
-DESPLAZAMIENTO_MONTON_X = 3
-DESPLAZAMIENTO_MONTON_Y = 3
 
 class VistaJuego(tk.Frame):
     # Clase para manejar la interfaz gráfica del juego
@@ -19,25 +23,86 @@ class VistaJuego(tk.Frame):
         self.ventana_padre = ventana_padre
         self.controlador = controlador
         self.recursos = gestor_recursos
+        self.ancho_lienzo, self.alto_lienzo = ANCHO_CANVAS, ALTO_CANVAS
+        self.escala = 1.0
+        self.ancho_carta, self.alto_carta = ANCHO_CARTA, ALTO_CARTA
         self.posiciones_montones = self._calcular_posiciones()
         self.animacion_ejecutandose = False
         self.carta_revelada = None
         self.monton_revelado = None
+        self.pantalla_actual = None
+        self.estado_dibujado = None
+        self.redimensionado_pendiente = None
+        self.botones = {}
 
         # Crear lienzo principal
         self.lienzo = tk.Canvas(self, bg="darkgreen", width=ANCHO_CANVAS, height=ALTO_CANVAS, highlightthickness=0)
         self.lienzo.pack(fill=tk.BOTH, expand=True)
         #ese es el llenado   
         # Crear etiquetas de texto
-        self.etiqueta_estado = tk.Label(self, text="", bg="darkgreen", fg="white", font=("Arial", 14))
-        self.etiqueta_carta_actual = tk.Label(self, text="", bg="darkgreen", fg="yellow", font=("Arial", 12, "bold"))
+        self.etiqueta_estado = tk.Label(self, text="", bg="darkgreen", fg="white", font=self._fuente(14))
+        self.etiqueta_carta_actual = tk.Label(self, text="", bg="darkgreen", fg="yellow", font=self._fuente(12, "bold"))
         
         # Posicionar etiquetas
-        self.lienzo.create_window(ANCHO_CANVAS / 2, 20, window=self.etiqueta_estado)
-        self.lienzo.create_window(ANCHO_CANVAS / 2, ALTO_CANVAS - 20, window=self.etiqueta_carta_actual)
+        self.lienzo.create_window(self.ancho_lienzo / 2, 20, window=self.etiqueta_estado)
+        self.lienzo.create_window(self.ancho_lienzo / 2, self.alto_lienzo - 20, window=self.etiqueta_carta_actual)
 
-        # Detectar clics del usuario
+        # Detectar clics del usuario y cambios de tamaño
         self.lienzo.bind("<Button-1>", self.al_hacer_clic_lienzo)
+        self.lienzo.bind("<Configure>", self.al_redimensionar_lienzo)
+
+    def al_redimensionar_lienzo(self, evento):
+        # Estirar lo dibujado al instante y reescalar las imágenes al terminar
+        if (evento.width, evento.height) == (self.ancho_lienzo, self.alto_lienzo):
+            return
+        factor_x = evento.width / self.ancho_lienzo
+        factor_y = evento.height / self.alto_lienzo
+        self.lienzo.scale("all", 0, 0, factor_x, factor_y)
+        self.ancho_lienzo, self.alto_lienzo = evento.width, evento.height
+
+        if self.redimensionado_pendiente:
+            self.after_cancel(self.redimensionado_pendiente)
+        self.redimensionado_pendiente = self.after(ESPERA_REDIMENSIONADO_MS, self._aplicar_redimensionado)
+
+    def _aplicar_redimensionado(self):
+        # Recalcular medidas y redibujar una sola vez tras el arrastre
+        self.redimensionado_pendiente = None
+        if self.animacion_ejecutandose:
+            self.redimensionado_pendiente = self.after(ESPERA_REDIMENSIONADO_MS, self._aplicar_redimensionado)
+            return
+
+        self.escala = min(self.ancho_lienzo / ANCHO_CANVAS, self.alto_lienzo / ALTO_CANVAS)
+        self.ancho_carta = max(1, round(ANCHO_CARTA * self.escala))
+        self.alto_carta = max(1, round(ALTO_CARTA * self.escala))
+        self.recursos.establecer_tamano(self.ancho_carta, self.alto_carta)
+        self.posiciones_montones = self._calcular_posiciones()
+        self._escalar_etiquetas()
+        self.redibujar()
+
+    def redibujar(self):
+        # Volver a pintar la pantalla que se esté mostrando
+        if self.pantalla_actual == 'menu':
+            self.mostrar_menu()
+        elif self.pantalla_actual == 'tablero' and self.estado_dibujado:
+            self.dibujar_tablero(self.estado_dibujado)
+
+    def cambiar_reverso(self, tema):
+        # Cambiar el diseño del reverso de las cartas
+        if self.recursos.cambiar_reverso(tema):
+            self.redibujar()
+
+    def _px(self, medida):
+        # Convertir una medida base a píxeles de la escala actual
+        return medida * self.escala
+
+    def _fuente(self, tamano, *estilo):
+        # Fuente proporcional a la escala, en píxeles (tamaño negativo en Tk):
+        # en puntos Tk la volvería a escalar con los ppp y crecería el doble que las cartas
+        return ("Arial", -max(6, round(tamano * PIXELES_POR_PUNTO * self.escala)), *estilo)
+
+    def _escalar_etiquetas(self):
+        self.etiqueta_estado.config(font=self._fuente(14))
+        self.etiqueta_carta_actual.config(font=self._fuente(12, "bold"))
 
     def al_hacer_clic_lienzo(self, evento):
         # Manejar clics en el lienzo
@@ -50,72 +115,130 @@ class VistaJuego(tk.Frame):
 
     def dibujar_tablero(self, estado_tablero):
         # Dibujar todo el tablero del juego
+        self.pantalla_actual = 'tablero'
+        self.estado_dibujado = {
+            'visible': dict(estado_tablero['visible']),
+            'conteos_ocultos': dict(estado_tablero['conteos_ocultos']),
+            'carta_actual': estado_tablero.get('carta_actual'),
+            'revelacion_pendiente': estado_tablero.get('revelacion_pendiente')
+        }
         self.lienzo.delete("monton", "botones_juego", "revelado", "botones_menu")
-        
-        montones_visibles = estado_tablero['visible']
-        conteos_ocultos = estado_tablero['conteos_ocultos']
-        carta_actual = estado_tablero.get('carta_actual')
-        revelacion_pendiente = estado_tablero.get('revelacion_pendiente')
 
         # Botón de menú
-        boton_menu = tk.Button(self, text="🏠 Menú Principal", 
-                              command=self.controlador.terminar_juego_actual, 
-                              bg="#4ECDC4", fg="black", font=("Arial", 9))
-        self.lienzo.create_window(ANCHO_CANVAS - 80, 40, window=boton_menu, tags="botones_juego")
+        boton_menu = self._obtener_boton('menu', text="🏠 Menú Principal", 
+                                         command=self.controlador.terminar_juego_actual, 
+                                         bg="#4ECDC4", fg="black", font=self._fuente(9))
+        self.lienzo.create_window(self.ancho_lienzo - self._px(80), self._px(40), window=boton_menu, tags="botones_juego")
 
         # Dibujar los 13 montones
         for i in range(1, 14):
-            x, y = self.posiciones_montones[i]
-            
-            # Resaltar montones según el estado
-            if revelacion_pendiente == i:
-                self.lienzo.create_rectangle(x - 8, y - 8, x + ANCHO_CARTA + 8, y + ALTO_CARTA + 8, 
-                                           fill="", outline="lime", width=5, tags="monton")
-            elif carta_actual and self.obtener_destino_carta(carta_actual) == i:
-                self.lienzo.create_rectangle(x - 6, y - 6, x + ANCHO_CARTA + 6, y + ALTO_CARTA + 6, 
-                                           fill="", outline="orange", width=3, tags="monton")
-
-            # Dibujar cartas ocultas
-            if conteos_ocultos.get(i, 0) > 0:
-                for j in range(min(conteos_ocultos[i], 5)):
-                     self.lienzo.create_image(x - j * DESPLAZAMIENTO_MONTON_X, 
-                                            y - j * DESPLAZAMIENTO_MONTON_Y, 
-                                            image=self.recursos.obtener_imagen('back'), 
-                                            anchor='nw', tags="monton")
-                if conteos_ocultos[i] > 1:
-                    self.lienzo.create_text(x + ANCHO_CARTA - 10, y + 10, 
-                                          text=str(conteos_ocultos[i]), 
-                                          fill="yellow", font=("Arial", 10, "bold"), tags="monton")
-
-            # Dibujar carta visible
-            nombre_carta = montones_visibles.get(i, 'back')
-            if nombre_carta != 'back':
-                imagen = self.recursos.obtener_imagen(nombre_carta)
-                if imagen: 
-                    self.lienzo.create_image(x, y, image=imagen, anchor='nw', tags="monton")
-            elif conteos_ocultos.get(i, 0) == 0:
-                self.lienzo.create_rectangle(x, y, x + ANCHO_CARTA, y + ALTO_CARTA, 
-                                           fill="darkgreen", outline="gray", dash=(5, 5), tags="monton")
-            
-            # Número del montón
-            self.lienzo.create_text(x + ANCHO_CARTA / 2, y - 15, text=str(i), 
-                                  fill="white", font=("Arial", 12, "bold"), tags="monton")
+            self._dibujar_monton(i)
 
         # Mostrar carta revelada si existe
         if self.carta_revelada and self.monton_revelado: 
             self.dibujar_carta_revelada()
             
-        self.actualizar_etiquetas_estado(carta_actual)
+        self.actualizar_etiquetas_estado(self.estado_dibujado['carta_actual'])
+
+    def aplicar_cambios(self, cambios):
+        # Actualizar solo los montones afectados por los eventos del modelo
+        estado = self.estado_dibujado
+        montones_sucios = set()
+        carta_actual_cambio = False
+
+        for cambio in cambios:
+            if isinstance(cambio, TableroRepartido):
+                self.dibujar_tablero({'visible': cambio.visibles, 'conteos_ocultos': cambio.conteos_ocultos,
+                                      'carta_actual': cambio.carta_actual, 'revelacion_pendiente': None})
+                montones_sucios.clear()
+                carta_actual_cambio = False
+            elif isinstance(cambio, CartaColocada):
+                estado['visible'][cambio.monton] = cambio.carta
+                montones_sucios.add(cambio.monton)
+            elif isinstance(cambio, ConteoOcultoCambiado):
+                estado['conteos_ocultos'][cambio.monton] = cambio.conteo
+                montones_sucios.add(cambio.monton)
+            elif isinstance(cambio, CartaActualCambiada):
+                # Cambia el resaltado del destino anterior y del nuevo
+                montones_sucios.add(self.obtener_destino_carta(estado['carta_actual']))
+                estado['carta_actual'] = cambio.carta
+                montones_sucios.add(self.obtener_destino_carta(cambio.carta))
+                carta_actual_cambio = True
+            elif isinstance(cambio, RevelacionPendienteCambiada):
+                montones_sucios.update((estado['revelacion_pendiente'], cambio.monton))
+                estado['revelacion_pendiente'] = cambio.monton
+
+        for i in sorted(montones_sucios - {None}):
+            self._redibujar_monton(i)
+        if carta_actual_cambio:
+            self.actualizar_etiquetas_estado(estado['carta_actual'])
+
+    def _redibujar_monton(self, indice_monton):
+        # Rehacer un montón manteniendo el orden de dibujo respecto a los demás
+        etiqueta = f"monton_{indice_monton}"
+        self.lienzo.delete(etiqueta)
+        self._dibujar_monton(indice_monton)
+        for siguiente in range(indice_monton + 1, 14):
+            if self.lienzo.find_withtag(f"monton_{siguiente}"):
+                self.lienzo.tag_lower(etiqueta, f"monton_{siguiente}")
+                break
+        self.lienzo.tag_raise("revelado")
+
+    def _dibujar_monton(self, i):
+        # Dibujar un montón a partir del estado dibujado
+        x, y = self.posiciones_montones[i]
+        ancho_carta, alto_carta = self.ancho_carta, self.alto_carta
+        etiquetas = ("monton", f"monton_{i}")
+        conteos_ocultos = self.estado_dibujado['conteos_ocultos']
+        carta_actual = self.estado_dibujado['carta_actual']
+        revelacion_pendiente = self.estado_dibujado['revelacion_pendiente']
+
+        # Resaltar montones según el estado
+        if revelacion_pendiente == i:
+            margen = self._px(8)
+            self.lienzo.create_rectangle(x - margen, y - margen, x + ancho_carta + margen, y + alto_carta + margen, 
+                                       fill="", outline="lime", width=self._px(5), tags=etiquetas)
+        elif carta_actual and self.obtener_destino_carta(carta_actual) == i:
+            margen = self._px(6)
+            self.lienzo.create_rectangle(x - margen, y - margen, x + ancho_carta + margen, y + alto_carta + margen, 
+                                       fill="", outline="orange", width=self._px(3), tags=etiquetas)
+
+        # Dibujar cartas ocultas
+        if conteos_ocultos.get(i, 0) > 0:
+            for j in range(min(conteos_ocultos[i], 5)):
+                 self.lienzo.create_image(x - j * self._px(DESPLAZAMIENTO_MONTON_X), 
+                                        y - j * self._px(DESPLAZAMIENTO_MONTON_Y), 
+                                        image=self.recursos.obtener_imagen('back'), 
+                                        anchor='nw', tags=etiquetas)
+            if conteos_ocultos[i] > 1:
+                self.lienzo.create_text(x + ancho_carta - self._px(10), y + self._px(10), 
+                                      text=str(conteos_ocultos[i]), 
+                                      fill="yellow", font=self._fuente(10, "bold"), tags=etiquetas)
+
+        # Dibujar carta visible
+        nombre_carta = self.estado_dibujado['visible'].get(i, 'back')
+        if nombre_carta != 'back':
+            imagen = self.recursos.obtener_imagen(nombre_carta)
+            if imagen: 
+                self.lienzo.create_image(x, y, image=imagen, anchor='nw', tags=etiquetas)
+        elif conteos_ocultos.get(i, 0) == 0:
+            self.lienzo.create_rectangle(x, y, x + ancho_carta, y + alto_carta, 
+                                       fill="darkgreen", outline="gray", dash=(5, 5), tags=etiquetas)
+        
+        # Número del montón
+        self.lienzo.create_text(x + ancho_carta / 2, y - self._px(15), text=str(i), 
+                              fill="white", font=self._fuente(12, "bold"), tags=etiquetas)
 
     def dibujar_carta_revelada(self):
         # Dibujar efectos especiales para carta revelada
         x_monton, y_monton = self.posiciones_montones[self.monton_revelado]
-        desplazamiento_x, desplazamiento_y = -15, -15
+        desplazamiento_x, desplazamiento_y = self._px(-15), self._px(-15)
+        margen = self._px(5)
         
         # Borde amarillo alrededor del montón
-        self.lienzo.create_rectangle(x_monton - 5, y_monton - 5, 
-                                   x_monton + ANCHO_CARTA + 5, y_monton + ALTO_CARTA + 5, 
-                                   fill="", outline="yellow", width=4, tags="revelado")
+        self.lienzo.create_rectangle(x_monton - margen, y_monton - margen, 
+                                   x_monton + self.ancho_carta + margen, y_monton + self.alto_carta + margen, 
+                                   fill="", outline="yellow", width=self._px(4), tags="revelado")
         
         # Carta revelada con desplazamiento
         imagen = self.recursos.obtener_imagen(self.carta_revelada)
@@ -125,18 +248,20 @@ class VistaJuego(tk.Frame):
         
         # Texto indicando destino
         destino = self.obtener_destino_carta(self.carta_revelada)
-        self.lienzo.create_text(x_monton + desplazamiento_x + ANCHO_CARTA/2, 
-                              y_monton + desplazamiento_y + ALTO_CARTA + 15, 
-                              text=f"→ Montón {destino}", fill="white", font=("Arial", 10, "bold"), tags="revelado")
+        self.lienzo.create_text(x_monton + desplazamiento_x + self.ancho_carta/2, 
+                              y_monton + desplazamiento_y + self.alto_carta + self._px(15), 
+                              text=f"→ Montón {destino}", fill="white", font=self._fuente(10, "bold"), tags="revelado")
 
     def mostrar_carta_revelada(self, carta, monton):
-        # Establecer carta revelada y redibujar
+        # Establecer carta revelada y dibujar solo su efecto
         self.carta_revelada, self.monton_revelado = carta, monton
-        self.dibujar_tablero(self.controlador.modelo.obtener_estado_tablero())
+        self.lienzo.delete("revelado")
+        self.dibujar_carta_revelada()
 
     def ocultar_carta_revelada(self):
         # Quitar efectos de carta revelada
         self.carta_revelada, self.monton_revelado = None, None
+        self.lienzo.delete("revelado")
 
     def animar_movimiento_carta(self, carta, monton_origen, monton_destino, funcion_callback=None):
         # Animar movimiento de carta entre montones
@@ -183,12 +308,14 @@ class VistaJuego(tk.Frame):
         self.animacion_ejecutandose = True
         
         # Limpiar lienzo pero mantener etiquetas
+        self.pantalla_actual = None
         self.lienzo.delete("all")
-        self.lienzo.create_window(ANCHO_CANVAS / 2, 20, window=self.etiqueta_estado)
-        self.lienzo.create_window(ANCHO_CANVAS / 2, ALTO_CANVAS - 20, window=self.etiqueta_carta_actual)
+        self.lienzo.create_window(self.ancho_lienzo / 2, 20, window=self.etiqueta_estado)
+        self.lienzo.create_window(self.ancho_lienzo / 2, self.alto_lienzo - 20, window=self.etiqueta_carta_actual)
         
         # Crear cartas que giran en círculo
-        centro_x, centro_y = ANCHO_CANVAS / 2, ALTO_CANVAS / 2
+        centro_x, centro_y = self.ancho_lienzo / 2, self.alto_lienzo / 2
+        radio_giro = self._px(80)
         cartas = []
         
         for i in range(8):
@@ -217,8 +344,8 @@ class VistaJuego(tk.Frame):
             # Mover cartas en círculo
             for i, carta in enumerate(cartas):
                 angulo = math.radians(paso * 9 + i * 45)
-                desplazamiento_x = 80 * math.cos(angulo)
-                desplazamiento_y = 80 * math.sin(angulo)
+                desplazamiento_x = radio_giro * math.cos(angulo)
+                desplazamiento_y = radio_giro * math.sin(angulo)
                 self.lienzo.coords(carta, centro_x + desplazamiento_x, centro_y + desplazamiento_y)
             
             paso += 1
@@ -258,53 +385,59 @@ class VistaJuego(tk.Frame):
 
     def mostrar_menu(self):
         # Mostrar menú principal con botones
+        self.pantalla_actual = 'menu'
         self.lienzo.delete("all")
         
         self.etiqueta_estado.config(text="🎴 Solitario Reloj 🎴")
         self.etiqueta_carta_actual.config(text="Selecciona un modo de juego para comenzar")
         
-        self.lienzo.create_window(ANCHO_CANVAS / 2, 40, window=self.etiqueta_estado)
-        self.lienzo.create_window(ANCHO_CANVAS / 2, ALTO_CANVAS - 20, window=self.etiqueta_carta_actual)
-
-        # Crear botones del menú
-        boton_automatico = tk.Button(self, text="🤖 Modo Automático", 
-                                   command=lambda: self.controlador.iniciar_juego_nuevo('auto'), 
-                                   font=("Arial", 12), width=20, height=2)
-        boton_manual = tk.Button(self, text="🎮 Modo Manual", 
-                               command=lambda: self.controlador.iniciar_juego_nuevo('manual'), 
-                               font=("Arial", 12), width=20, height=2)
-        boton_barajar = tk.Button(self, text="🎲 Barajar y Reiniciar", 
-                                command=self.controlador.barajar_cartas, 
-                                font=("Arial", 12), width=20, height=2)
-        boton_salir = tk.Button(self, text="❌ Salir del Juego", 
-                              command=self.controlador.salir_juego, 
-                              font=("Arial", 12), width=20, height=2)
+        centro_x, centro_y = self.ancho_lienzo / 2, self.alto_lienzo / 2
+        self.lienzo.create_window(centro_x, self._px(40), window=self.etiqueta_estado)
+        self.lienzo.create_window(centro_x, self.alto_lienzo - self._px(20), window=self.etiqueta_carta_actual)
+
+        # Botones del menú (se crean la primera vez y luego se reutilizan)
+        boton_automatico = self._obtener_boton('automatico', text="🤖 Modo Automático", 
+                                               command=lambda: self.controlador.iniciar_juego_nuevo('auto'), 
+                                               font=self._fuente(12), width=20, height=2)
+        boton_manual = self._obtener_boton('manual', text="🎮 Modo Manual", 
+                                           command=lambda: self.controlador.iniciar_juego_nuevo('manual'), 
+                                           font=self._fuente(12), width=20, height=2)
+        boton_barajar = self._obtener_boton('barajar', text="🎲 Barajar y Reiniciar", 
+                                            command=self.controlador.barajar_cartas, 
+                                            font=self._fuente(12), width=20, height=2)
+        boton_reverso = self._obtener_boton('reverso', text="🎨 Cambiar Reverso", 
+                                            command=self.controlador.cambiar_reverso, 
+                                            font=self._fuente(12), width=20, height=2)
+        boton_salir = self._obtener_boton('salir', text="❌ Salir del Juego", 
+                                          command=self.controlador.salir_juego, 
+                                          font=self._fuente(12), width=20, height=2)
         
-        # Posicionar botones
-        self.lienzo.create_window(ANCHO_CANVAS / 2, ALTO_CANVAS / 2 - 100, window=boton_automatico, tags="botones_menu")
-        self.lienzo.create_window(ANCHO_CANVAS / 2, ALTO_CANVAS / 2 - 30, window=boton_manual, tags="botones_menu")
-        self.lienzo.create_window(ANCHO_CANVAS / 2, ALTO_CANVAS / 2 + 40, window=boton_barajar, tags="botones_menu")
-        self.lienzo.create_window(ANCHO_CANVAS / 2, ALTO_CANVAS / 2 + 110, window=boton_salir, tags="botones_menu")
+        # Posicionar botones (separación proporcional a la escala)
+        self.lienzo.create_window(centro_x, centro_y + self._px(-135), window=boton_automatico, tags="botones_menu")
+        self.lienzo.create_window(centro_x, centro_y + self._px(-65), window=boton_manual, tags="botones_menu")
+        self.lienzo.create_window(centro_x, centro_y + self._px(5), window=boton_barajar, tags="botones_menu")
+        self.lienzo.create_window(centro_x, centro_y + self._px(75), window=boton_reverso, tags="botones_menu")
+        self.lienzo.create_window(centro_x, centro_y + self._px(145), window=boton_salir, tags="botones_menu")
+
+    def _obtener_boton(self, clave, **opciones):
+        # Crear cada botón una sola vez; borrar su ventana del lienzo no lo destruye
+        boton = self.botones.get(clave)
+        if boton is None:
+            boton = tk.Button(self, **opciones)
+            self.botones[clave] = boton
+        elif 'font' in opciones:
+            # La fuente depende de la escala actual
+            boton.config(font=opciones['font'])
+        return boton
 
     def _calcular_posiciones(self):
         # Calcular posiciones de montones en forma de reloj
-        posiciones = {}
-        centro_x, centro_y, radio = ANCHO_CANVAS / 2, ALTO_CANVAS / 2, 250
-        
-        # Montones 1-12 en círculo como reloj
-        for i in range(1, 13):
-            angulo = math.radians(-60 + (i * 30))  # -60°  
-            x = centro_x + radio * math.cos(angulo) - (ANCHO_CARTA / 2)
-            y = centro_y + radio * math.sin(angulo) - (ALTO_CARTA / 2)
-            posiciones[i] = (x, y)
-        
-        # Montón 13 en el centro
-        posiciones[13] = (centro_x - ANCHO_CARTA / 2, centro_y - ALTO_CARTA / 2)
-        return posiciones
+        return calcular_posiciones_montones(self.ancho_lienzo, self.alto_lienzo,
+                                            self.ancho_carta, self.alto_carta, self._px(RADIO_RELOJ))
 
     def _identificar_monton(self, x, y):
         # Identificar en qué montón hizo clic el usuario
         for i, (pos_x, pos_y) in self.posiciones_montones.items():
-            if pos_x <= x <= pos_x + ANCHO_CARTA and pos_y <= y <= pos_y + ALTO_CARTA:
+            if pos_x <= x <= pos_x + self.ancho_carta and pos_y <= y <= pos_y + self.alto_carta:
                 return i
         return None
\ No newline at end of file
@@ -0,0 +1,264 @@
+# tkstub.py - Sustituto mínimo de tkinter para ejecutar el juego sin pantalla
+#
+# Implementa solo lo que usan VistaJuego, ControladorJuego y GestorRecursos.
+# Los temporizadores van con un reloj virtual: avanzar() salta al siguiente
+# sin esperar. instalar() lo registra como tkinter (y PIL.ImageTk) antes de
+# importar el juego.
+
+import heapq
+import itertools
+import sys
+import types
+
+BOTH = "both"
+
+
+class Widget:
+    # Base de todos los widgets: jerarquía, opciones y temporizadores de la raíz
+
+    def __init__(self, master=None, **opciones):
+        self.master = master
+        self.opciones = dict(opciones)
+        self.hijos = []
+        self._raiz = master._raiz if master is not None else self
+        if master is not None:
+            master.hijos.append(self)
+
+    def winfo_children(self):
+        return list(self.hijos)
+
+    def pack(self, **opciones):
+        pass
+
+    def config(self, **opciones):
+        self.opciones.update(opciones)
+
+    configure = config
+
+    def bind(self, evento, funcion):
+        pass
+
+    def after(self, ms, funcion=None, *argumentos):
+        return self._raiz._programar(ms, funcion, argumentos)
+
+    def after_cancel(self, identificador):
+        self._raiz._cancelados.add(identificador)
+
+    def update(self):
+        self._raiz._ejecutar_vencidos()
+
+    def destroy(self):
+        if self.master is not None and self in self.master.hijos:
+            self.master.hijos.remove(self)
+
+
+class _Interprete:
+    # Lo justo de ventana.tk para consultar 'after info'
+
+    def __init__(self, raiz):
+        self.raiz = raiz
+
+    def call(self, *argumentos):
+        if argumentos == ('after', 'info'):
+            return tuple(self.raiz._pendientes())
+        raise NotImplementedError(f"tkstub no implementa {argumentos}")
+
+    def splitlist(self, valor):
+        return tuple(valor)
+
+
+class Tk(Widget):
+    # Ventana raíz con reloj virtual en milisegundos
+
+    def __init__(self):
+        super().__init__(None)
+        self.reloj = 0
+        self._cola = []
+        self._contador = itertools.count()
+        self._cancelados = set()
+        self.tk = _Interprete(self)
+
+    def title(self, texto):
+        pass
+
+    def geometry(self, texto):
+        pass
+
+    def minsize(self, ancho, alto):
+        pass
+
+    def resizable(self, ancho, alto):
+        pass
+
+    def winfo_fpixels(self, medida):
+        return 96.0
+
+    def _programar(self, ms, funcion, argumentos):
+        numero = next(self._contador)
+        identificador = f"after#{numero}"
+        heapq.heappush(self._cola, (self.reloj + ms, numero, identificador, funcion, argumentos))
+        return identificador
+
+    def _pendientes(self):
+        return [entrada[2] for entrada in self._cola if entrada[2] not in self._cancelados]
+
+    def _ejecutar_vencidos(self):
+        while self._cola and self._cola[0][0] <= self.reloj:
+            _, _, identificador, funcion, argumentos = heapq.heappop(self._cola)
+            if identificador in self._cancelados:
+                self._cancelados.discard(identificador)
+            elif funcion is not None:
+                funcion(*argumentos)
+
+    def avanzar(self):
+        # Adelantar el reloj hasta el próximo temporizador y ejecutarlo;
+        # False si no queda ninguno
+        while self._cola and self._cola[0][2] in self._cancelados:
+            self._cancelados.discard(heapq.heappop(self._cola)[2])
+        if not self._cola:
+            return False
+        self.reloj = max(self.reloj, self._cola[0][0])
+        self._ejecutar_vencidos()
+        return True
+
+    def mainloop(self):
+        while self.avanzar():
+            pass
+
+
+class Frame(Widget):
+    pass
+
+
+class Label(Widget):
+    pass
+
+
+class Button(Widget):
+    pass
+
+
+class Canvas(Widget):
+    # Guarda los elementos en orden de apilado: [tipo, coordenadas, opciones, etiquetas]
+
+    def __init__(self, master=None, **opciones):
+        super().__init__(master, **opciones)
+        self.elementos = {}
+        self._ids = itertools.count(1)
+
+    def _crear(self, tipo, coordenadas, opciones):
+        etiquetas = opciones.pop('tags', ())
+        if isinstance(etiquetas, str):
+            etiquetas = (etiquetas,)
+        identificador = next(self._ids)
+        self.elementos[identificador] = [tipo, list(coordenadas), opciones, tuple(etiquetas)]
+        return identificador
+
+    def create_image(self, *coordenadas, **opciones):
+        return self._crear('image', coordenadas, opciones)
+
+    def create_rectangle(self, *coordenadas, **opciones):
+        return self._crear('rectangle', coordenadas, opciones)
+
+    def create_text(self, *coordenadas, **opciones):
+        return self._crear('text', coordenadas, opciones)
+
+    def create_window(self, *coordenadas, **opciones):
+        return self._crear('window', coordenadas, opciones)
+
+    def _buscar(self, etiqueta):
+        if isinstance(etiqueta, int):
+            return [etiqueta] if etiqueta in self.elementos else []
+        if etiqueta == 'all':
+            return list(self.elementos)
+        return [identificador for identificador, elemento in self.elementos.items() if etiqueta in elemento[3]]
+
+    def find_all(self):
+        return tuple(self.elementos)
+
+    def find_withtag(self, etiqueta):
+        return tuple(self._buscar(etiqueta))
+
+    def delete(self, *etiquetas):
+        for etiqueta in etiquetas:
+            for identificador in self._buscar(etiqueta):
+                del self.elementos[identificador]
+
+    def _reordenar(self, etiqueta, referencia, debajo):
+        mover = self._buscar(etiqueta)
+        if not mover:
+            return
+        resto = [identificador for identificador in self.elementos if identificador not in mover]
+        anclas = [identificador for identificador in self._buscar(referencia) if identificador not in mover] \
+            if referencia is not None else []
+        if debajo:
+            posicion = resto.index(anclas[0]) if anclas else 0
+        else:
+            posicion = resto.index(anclas[-1]) + 1 if anclas else len(resto)
+        orden = resto[:posicion] + mover + resto[posicion:]
+        self.elementos = {identificador: self.elementos[identificador] for identificador in orden}
+
+    def tag_lower(self, etiqueta, debajo_de=None):
+        self._reordenar(etiqueta, debajo_de, True)
+
+    def tag_raise(self, etiqueta, encima_de=None):
+        self._reordenar(etiqueta, encima_de, False)
+
+    def move(self, etiqueta, dx, dy):
+        for identificador in self._buscar(etiqueta):
+            coordenadas = self.elementos[identificador][1]
+            for i in range(len(coordenadas)):
+                coordenadas[i] += dx if i % 2 == 0 else dy
+
+    def coords(self, etiqueta, *coordenadas):
+        elementos = self._buscar(etiqueta)
+        if coordenadas and elementos:
+            self.elementos[elementos[0]][1] = list(coordenadas)
+        return self.elementos[elementos[0]][1] if elementos else []
+
+    def scale(self, etiqueta, x_origen, y_origen, factor_x, factor_y):
+        for identificador in self._buscar(etiqueta):
+            coordenadas = self.elementos[identificador][1]
+            for i in range(len(coordenadas)):
+                if i % 2 == 0:
+                    coordenadas[i] = x_origen + (coordenadas[i] - x_origen) * factor_x
+                else:
+                    coordenadas[i] = y_origen + (coordenadas[i] - y_origen) * factor_y
+
+    def itemconfig(self, etiqueta, **opciones):
+        for identificador in self._buscar(etiqueta):
+            self.elementos[identificador][2].update(opciones)
+
+
+class PhotoImage:
+    # Sustituto de PIL.ImageTk.PhotoImage: guarda la imagen de Pillow
+
+    def __init__(self, imagen=None, **opciones):
+        self.imagen = imagen
+
+    def width(self):
+        return self.imagen.width if self.imagen else 0
+
+    def height(self):
+        return self.imagen.height if self.imagen else 0
+
+
+def _mostrar_mensaje(titulo, mensaje, **opciones):
+    return "ok"
+
+
+messagebox = types.ModuleType("tkinter.messagebox")
+messagebox.showinfo = _mostrar_mensaje
+
+
+def instalar():
+    # Registrar este módulo como tkinter; llamar antes de importar la vista
+    modulo = sys.modules[__name__]
+    sys.modules['tkinter'] = modulo
+    sys.modules['tkinter.messagebox'] = messagebox
+
+    image_tk = types.ModuleType("PIL.ImageTk")
+    image_tk.PhotoImage = PhotoImage
+    sys.modules['PIL.ImageTk'] = image_tk
+    import PIL
+    PIL.ImageTk = image_tk